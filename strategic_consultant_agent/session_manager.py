@@ -8,11 +8,28 @@ For simplicity in this capstone project, we provide wrapper classes that
 demonstrate the concept of session persistence and multi-turn conversations.
 """
 
+import threading
+from collections import deque
+from functools import lru_cache
+from typing import Deque, Set
+
+from google.adk.agents import SequentialAgent
 from google.adk.runners import InMemoryRunner
 
 from strategic_consultant_agent.agent import create_strategic_analyzer
 
 
+@lru_cache(maxsize=1)
+def _cached_analyzer() -> SequentialAgent:
+    """
+    Build the strategic analyzer once and share it across sessions and runners.
+
+    Returns:
+        SequentialAgent: The root strategic analyzer agent
+    """
+    return create_strategic_analyzer()
+
+
 class StrategicConsultantSession:
     """
     Manages multi-turn conversation sessions with the strategic consultant agent.
@@ -48,7 +65,7 @@ class StrategicConsultantSession:
             session_id: Session ID (default: "default_session")
             app_name: Application name (default: "strategic_consultant")
         """
-        self.agent = create_strategic_analyzer()
+        self.agent = _cached_analyzer()
         self.runner = InMemoryRunner(
             agent=self.agent,
             app_name=app_name,
@@ -104,6 +121,114 @@ class StrategicConsultantSession:
         return self.user_id
 
 
+class SessionPool:
+    """
+    Pool of pre-built sessions handed out on demand.
+
+    Sessions are created in batches, so a burst of requests does not build
+    runners one at a time. Releasing a session retires it and puts a fresh
+    one, with a new session ID and runner, back in the pool, so no borrower
+    ever sees another borrower's conversation state. The pool is safe to
+    share between threads.
+
+    Example:
+        >>> pool = SessionPool(min_sessions=2)
+        >>> session = pool.acquire()
+        >>> for event in session.run("Should we scale fall detection?"):
+        ...     print(event)
+        >>> pool.release(session)
+    """
+
+    def __init__(
+        self,
+        min_sessions: int = 4,
+        inc_step: int = 25,
+        user_id: str = "default_user",
+        app_name: str = "strategic_consultant",
+    ):
+        """
+        Initialize the pool and pre-create min_sessions sessions.
+
+        Args:
+            min_sessions: Sessions created up front (default: 4)
+            inc_step: Sessions created per batch when the pool is empty
+                (default: 25)
+            user_id: User ID for pooled sessions (default: "default_user")
+            app_name: Application name (default: "strategic_consultant")
+
+        Raises:
+            ValueError: If min_sessions is negative or inc_step is below 1
+        """
+        if min_sessions < 0:
+            raise ValueError("min_sessions must be >= 0")
+        if inc_step < 1:
+            raise ValueError("inc_step must be >= 1")
+
+        self.inc_step = inc_step
+        self.user_id = user_id
+        self.app_name = app_name
+        self._created = 0
+        self._available: Deque[StrategicConsultantSession] = deque()
+        self._in_use: Set[StrategicConsultantSession] = set()
+        self._lock = threading.Lock()
+        with self._lock:
+            self._grow(min_sessions)
+
+    def _grow(self, count: int) -> None:
+        """
+        Create a batch of sessions with unique session IDs.
+
+        Callers must hold self._lock.
+
+        Args:
+            count: Number of sessions to create
+        """
+        for _ in range(count):
+            self._created += 1
+            self._available.append(
+                StrategicConsultantSession(
+                    user_id=self.user_id,
+                    session_id=f"pooled_session_{self._created}",
+                    app_name=self.app_name,
+                )
+            )
+
+    def acquire(self) -> StrategicConsultantSession:
+        """
+        Take a session from the pool, creating a batch if it is empty.
+
+        Returns:
+            StrategicConsultantSession: A session ready to run
+        """
+        with self._lock:
+            if not self._available:
+                self._grow(self.inc_step)
+            session = self._available.pop()
+            self._in_use.add(session)
+        return session
+
+    def release(self, session: StrategicConsultantSession) -> None:
+        """
+        Retire a session and replace it with a fresh one in the pool.
+
+        Args:
+            session: Session previously returned by acquire()
+
+        Raises:
+            ValueError: If the session was not acquired from this pool or
+                was already released
+        """
+        with self._lock:
+            if session not in self._in_use:
+                raise ValueError("Session is not checked out from this pool")
+            self._in_use.remove(session)
+            self._grow(1)
+
+    def __len__(self) -> int:
+        """Number of sessions currently available in the pool."""
+        return len(self._available)
+
+
 def create_runner() -> InMemoryRunner:
     """
     Create a runner for the strategic consultant agent.
@@ -123,9 +248,8 @@ def create_runner() -> InMemoryRunner:
         ... ):
         ...     print(event)
     """
-    agent = create_strategic_analyzer()
     return InMemoryRunner(
-        agent=agent,
+        agent=_cached_analyzer(),
         app_name="strategic_consultant",
     )
 
@@ -1,8 +1,38 @@
 """Framework template loading and validation system."""
 
 import json
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple
+
+# orjson.loads or json.loads; both accept the template file's bytes
+_json_loads: Callable[[bytes], Any]
+try:
+    # Optional faster decoder (pip install strategic-consultant-agent[fast])
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+
+# Bundled template file shipped with the package
+BUNDLED_TEMPLATE_PATH = (
+    Path(__file__).parent.parent / "data" / "framework_templates.json"
+)
+
+
+@lru_cache(maxsize=1)
+def _read_bundled_templates() -> bytes:
+    """
+    Read the bundled template file once per process.
+
+    The raw bytes are cached rather than the parsed dict so every
+    FrameworkLoader still gets its own independent copy of the templates.
+
+    Returns:
+        bytes: Contents of framework_templates.json
+    """
+    return BUNDLED_TEMPLATE_PATH.read_bytes()
 
 
 class FrameworkLoader:
@@ -18,11 +48,11 @@ class FrameworkLoader:
         """
         if template_path is None:
             # Use bundled template file
-            current_dir = Path(__file__).parent.parent
-            template_path = current_dir / "data" / "framework_templates.json"
+            template_path = BUNDLED_TEMPLATE_PATH
 
         self.template_path = Path(template_path)
         self.frameworks = self._load_templates()
+        self._trigger_patterns = self._compile_trigger_patterns()
 
     def _load_templates(self) -> Dict:
         """
@@ -35,14 +65,17 @@ class FrameworkLoader:
             FileNotFoundError: If template file doesn't exist
             json.JSONDecodeError: If JSON is malformed
         """
-        if not self.template_path.exists():
+        if self.template_path == BUNDLED_TEMPLATE_PATH:
+            raw = _read_bundled_templates()
+        elif not self.template_path.exists():
             raise FileNotFoundError(
                 f"Framework templates not found at {self.template_path}"
             )
+        else:
+            raw = self.template_path.read_bytes()
 
         try:
-            with open(self.template_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _json_loads(raw)
 
             # Validate structure
             self._validate_structure(data)
@@ -79,6 +112,27 @@ class FrameworkLoader:
             if name != "custom" and not framework["L1_categories"]:
                 raise ValueError(f"Framework '{name}' has empty 'L1_categories'")
 
+    def _compile_trigger_patterns(self) -> List[Tuple[Pattern, Dict]]:
+        """
+        Compile each framework's trigger phrases into one case-insensitive regex.
+
+        Patterns keep template order so earlier frameworks win ties, matching
+        the order in which trigger phrases were previously checked.
+
+        Returns:
+            list: (compiled pattern, framework) pairs
+        """
+        patterns = []
+        for framework in self.frameworks.get("frameworks", {}).values():
+            triggers = framework.get("trigger_phrases")
+            if triggers:
+                pattern = re.compile(
+                    "|".join(re.escape(trigger) for trigger in triggers),
+                    re.IGNORECASE,
+                )
+                patterns.append((pattern, framework))
+        return patterns
+
     def get_framework(self, name: str) -> Optional[Dict]:
         """
         Get a specific framework by name.
@@ -101,14 +155,10 @@ class FrameworkLoader:
         Returns:
             dict: Best matching framework or None
         """
-        phrase_lower = phrase.lower()
-
-        # Check each framework's trigger phrases
-        for framework in self.frameworks.get("frameworks", {}).values():
-            if "trigger_phrases" in framework:
-                for trigger in framework["trigger_phrases"]:
-                    if trigger.lower() in phrase_lower:
-                        return framework
+        # Check each framework's precompiled trigger pattern
+        for pattern, framework in self._trigger_patterns:
+            if pattern.search(phrase):
+                return framework
 
         return None
 
@@ -134,10 +184,7 @@ class FrameworkLoader:
         return result
 
 
-# Global instance (singleton pattern)
-_loader_instance: Optional[FrameworkLoader] = None
-
-
+@lru_cache(maxsize=1)
 def get_framework_loader() -> FrameworkLoader:
     """
     Get the global FrameworkLoader instance (singleton).
@@ -145,10 +192,7 @@ def get_framework_loader() -> FrameworkLoader:
     Returns:
         FrameworkLoader: Singleton instance
     """
-    global _loader_instance
-    if _loader_instance is None:
-        _loader_instance = FrameworkLoader()
-    return _loader_instance
+    return FrameworkLoader()
 
 
 # Convenience functions
@@ -164,8 +208,7 @@ def load_framework(name: str) -> Optional[Dict]:
     Returns:
         dict: Framework definition or None
     """
-    loader = get_framework_loader()
-    return loader.get_framework(name)
+    return get_framework_loader().get_framework(name)
 
 
 def find_framework_by_trigger(phrase: str) -> Optional[Dict]:
@@ -178,8 +221,7 @@ def find_framework_by_trigger(phrase: str) -> Optional[Dict]:
     Returns:
         dict: Framework or None
     """
-    loader = get_framework_loader()
-    return loader.get_framework_by_trigger(phrase)
+    return get_framework_loader().get_framework_by_trigger(phrase)
 
 
 def list_available_frameworks() -> List[str]:
@@ -189,5 +231,4 @@ def list_available_frameworks() -> List[str]:
     Returns:
         list: Framework names
     """
-    loader = get_framework_loader()
-    return loader.list_frameworks()
+    return get_framework_loader().list_frameworks()
@@ -1,6 +1,9 @@
 """Generate MECE hypothesis trees from framework templates."""
 
-from typing import Dict, List, Optional
+import json
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Pattern, Tuple
 
 from strategic_consultant_agent.tools.framework_loader import load_framework
 from strategic_consultant_agent.tools.llm_tree_generators import (
@@ -12,6 +15,69 @@ from strategic_consultant_agent.tools.llm_tree_generators import (
     generate_l1_category_batch_with_validation,
 )
 
+# Suggested L3 factors generated per custom L1 category
+_CUSTOM_FACTOR_NUMBERS = (1, 2, 3)
+
+
+def _keywords(*words: str) -> Pattern[str]:
+    """Compile lowercase keywords into one substring pattern."""
+    return re.compile("|".join(map(re.escape, words)))
+
+
+# Label keywords, matched as substrings of the lowercased label
+_BINARY_KEYWORDS = _keywords(
+    "exists", "available", "possible", "capable", "compliance", "ready"
+)
+_QUANT_KEYWORDS = _keywords(
+    "rate",
+    "cost",
+    "time",
+    "reduction",
+    "improvement",
+    "size",
+    "growth",
+    "revenue",
+    "savings",
+    "number",
+    "percent",
+    "roi",
+)
+
+# Quantitative targets, checked in order
+_QUANT_TARGETS = (
+    (_keywords("reduction", "improvement"), ">25% improvement vs baseline"),
+    (_keywords("cost", "savings"), "Positive ROI within 12 months"),
+    (_keywords("time"), "<30 days implementation"),
+)
+
+# Data sources, checked in order
+_DATA_SOURCES = (
+    (
+        _keywords("cost", "revenue", "savings", "roi"),
+        "Financial reports, budget analysis",
+    ),
+    (
+        _keywords("system", "integration", "technical", "infrastructure"),
+        "Technical specifications, vendor documentation",
+    ),
+    (
+        _keywords("satisfaction", "acceptance", "value", "experience"),
+        "Surveys, interviews, user feedback",
+    ),
+    (
+        _keywords("capacity", "workflow", "operational", "process"),
+        "Operational metrics, process data",
+    ),
+    (
+        _keywords("regulatory", "compliance", "legal", "risk"),
+        "Regulatory documentation, compliance audits",
+    ),
+    (
+        _keywords("market", "competitive", "industry", "trend"),
+        "Market research, industry reports",
+    ),
+)
+
 
 def generate_hypothesis_tree(
     problem: str,
@@ -33,6 +99,70 @@ def generate_hypothesis_tree(
         competitor_research: Competitive analysis context for LLM generation (optional)
         use_llm_generation: If True, use LLM to generate L2/L3 content (default: True)
 
+    Returns:
+        dict: Complete hypothesis tree structure with L1, L2, L3 levels
+    """
+    if use_llm_generation and (market_research or competitor_research):
+        return _build_hypothesis_tree(
+            problem,
+            framework,
+            custom_l1_categories,
+            market_research,
+            competitor_research,
+            use_llm_generation,
+        )
+
+    # Template-only trees are deterministic; decode a fresh copy of the cached tree
+    tree: Dict = json.loads(
+        _template_tree_json(problem, framework, tuple(custom_l1_categories or ()))
+    )
+    return tree
+
+
+@lru_cache(maxsize=128)
+def _template_tree_json(
+    problem: str, framework: str, custom_l1_categories: Tuple[str, ...]
+) -> str:
+    """
+    Build a template-only hypothesis tree and cache it as JSON.
+
+    Args:
+        problem: The strategic question to analyze
+        framework: Framework name (see generate_hypothesis_tree)
+        custom_l1_categories: User-defined L1 categories, empty if not custom
+
+    Returns:
+        str: Serialized hypothesis tree
+    """
+    return json.dumps(
+        _build_hypothesis_tree(
+            problem,
+            framework,
+            list(custom_l1_categories) or None,
+            use_llm_generation=False,
+        )
+    )
+
+
+def _build_hypothesis_tree(
+    problem: str,
+    framework: str,
+    custom_l1_categories: Optional[List[str]] = None,
+    market_research: Optional[str] = None,
+    competitor_research: Optional[str] = None,
+    use_llm_generation: bool = True,
+) -> Dict:
+    """
+    Build a hypothesis tree, generating L2/L3 content with the LLM if requested.
+
+    Args:
+        problem: The strategic question to analyze
+        framework: Framework name (see generate_hypothesis_tree)
+        custom_l1_categories: User-defined L1 categories (only if framework="custom")
+        market_research: Market research context for LLM generation (optional)
+        competitor_research: Competitive analysis context for LLM generation (optional)
+        use_llm_generation: If True, use LLM to generate L2/L3 content
+
     Returns:
         dict: Complete hypothesis tree structure with L1, L2, L3 levels
     """
@@ -196,34 +326,29 @@ def _build_custom_framework(categories: List[str]) -> Dict:
     Returns:
         dict: Framework template structure
     """
-    framework = {
+    # Use simple uppercase key without L1_ prefix to match template pattern
+    return {
         "name": "Custom Framework",
         "description": "User-defined framework",
-        "L1_categories": {},
+        "L1_categories": {
+            category.upper().replace(" ", "_"): {
+                "label": category,
+                "question": f"How does {category} affect the decision?",
+                "description": f"Analysis of {category}",
+                "L2_branches": {
+                    "ANALYSIS": {
+                        "label": f"{category} Analysis",
+                        "question": f"What are the key {category} considerations?",
+                        "suggested_L3": [
+                            f"{category} Factor {n}" for n in _CUSTOM_FACTOR_NUMBERS
+                        ],
+                    }
+                },
+            }
+            for category in categories
+        },
     }
 
-    for category in categories:
-        # Use simple uppercase key without L1_ prefix to match template pattern
-        l1_key = category.upper().replace(" ", "_")
-        framework["L1_categories"][l1_key] = {
-            "label": category,
-            "question": f"How does {category} affect the decision?",
-            "description": f"Analysis of {category}",
-            "L2_branches": {
-                "ANALYSIS": {
-                    "label": f"{category} Analysis",
-                    "question": f"What are the key {category} considerations?",
-                    "suggested_L3": [
-                        f"{category} Factor 1",
-                        f"{category} Factor 2",
-                        f"{category} Factor 3",
-                    ],
-                }
-            },
-        }
-
-    return framework
-
 
 def _generate_l3_leaf(
     label: str,
@@ -283,34 +408,9 @@ def _infer_metric_type(label: str) -> str:
     """
     label_lower = label.lower()
 
-    # Binary indicators
-    binary_keywords = [
-        "exists",
-        "available",
-        "possible",
-        "capable",
-        "compliance",
-        "ready",
-    ]
-    if any(keyword in label_lower for keyword in binary_keywords):
+    if _BINARY_KEYWORDS.search(label_lower):
         return "binary"
-
-    # Quantitative indicators
-    quant_keywords = [
-        "rate",
-        "cost",
-        "time",
-        "reduction",
-        "improvement",
-        "size",
-        "growth",
-        "revenue",
-        "savings",
-        "number",
-        "percent",
-        "roi",
-    ]
-    if any(keyword in label_lower for keyword in quant_keywords):
+    if _QUANT_KEYWORDS.search(label_lower):
         return "quantitative"
 
     # Default to qualitative
@@ -331,14 +431,11 @@ def _generate_target(label: str, metric_type: str) -> str:
     if metric_type == "binary":
         return "Yes / Confirmed"
     elif metric_type == "quantitative":
-        if "reduction" in label.lower() or "improvement" in label.lower():
-            return ">25% improvement vs baseline"
-        elif "cost" in label.lower() or "savings" in label.lower():
-            return "Positive ROI within 12 months"
-        elif "time" in label.lower():
-            return "<30 days implementation"
-        else:
-            return "Measurable positive impact"
+        label_lower = label.lower()
+        for pattern, target in _QUANT_TARGETS:
+            if pattern.search(label_lower):
+                return target
+        return "Measurable positive impact"
     else:  # qualitative
         return "Strong positive assessment from stakeholders"
 
@@ -356,42 +453,9 @@ def _suggest_data_source(label: str, l2_context: str) -> str:
     """
     label_lower = label.lower()
 
-    # Financial data
-    if any(word in label_lower for word in ["cost", "revenue", "savings", "roi"]):
-        return "Financial reports, budget analysis"
-
-    # Technical data
-    if any(
-        word in label_lower
-        for word in ["system", "integration", "technical", "infrastructure"]
-    ):
-        return "Technical specifications, vendor documentation"
-
-    # User/stakeholder data
-    if any(
-        word in label_lower
-        for word in ["satisfaction", "acceptance", "value", "experience"]
-    ):
-        return "Surveys, interviews, user feedback"
-
-    # Operational data
-    if any(
-        word in label_lower
-        for word in ["capacity", "workflow", "operational", "process"]
-    ):
-        return "Operational metrics, process data"
-
-    # Regulatory/compliance
-    if any(
-        word in label_lower for word in ["regulatory", "compliance", "legal", "risk"]
-    ):
-        return "Regulatory documentation, compliance audits"
-
-    # Market data
-    if any(
-        word in label_lower for word in ["market", "competitive", "industry", "trend"]
-    ):
-        return "Market research, industry reports"
+    for pattern, data_source in _DATA_SOURCES:
+        if pattern.search(label_lower):
+            return data_source
 
     # Default
     return f"{l2_context} data and analysis"
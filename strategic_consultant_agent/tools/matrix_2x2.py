@@ -1,5 +1,6 @@
 """Generate 2x2 prioritization and positioning matrices."""
 
+from functools import lru_cache
 from typing import Dict, List, Optional
 
 
@@ -23,8 +24,14 @@ def generate_2x2_matrix(
     Returns:
         dict: Matrix with quadrant definitions and item placements
     """
-    # Get quadrant definitions based on matrix type
-    quadrants = _get_quadrant_definitions(matrix_type, x_axis, y_axis)
+    # Get quadrant definitions based on matrix type, copied out of the cache
+    # so callers can edit the returned matrix
+    quadrants = {
+        quadrant_id: dict(definition)
+        for quadrant_id, definition in _get_quadrant_definitions(
+            matrix_type, x_axis, y_axis
+        ).items()
+    }
 
     # Assess items if not provided
     if assessments is None:
@@ -48,10 +55,15 @@ def generate_2x2_matrix(
     }
 
 
+@lru_cache(maxsize=32)
 def _get_quadrant_definitions(matrix_type: str, x_axis: str, y_axis: str) -> Dict:
     """
     Get quadrant definitions based on matrix type.
 
+    Results are cached per (matrix_type, x_axis, y_axis), so the returned dict
+    is shared between calls and must not be mutated; generate_2x2_matrix
+    hands out a copy.
+
     Args:
         matrix_type: Type of matrix
         x_axis: X-axis label
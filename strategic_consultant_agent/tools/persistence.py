@@ -1,88 +1,535 @@
 """Persistence tools for saving and loading analysis artifacts."""
 
+import errno
 import json
+import logging
+import mmap
 import os
+import re
+import shutil
+import sqlite3
+import tempfile
+import threading
+from collections import defaultdict
+from contextlib import closing
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+try:
+    # Optional faster encoder/decoder (pip install strategic-consultant-agent[fast])
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 
 # Default storage directory
 DEFAULT_STORAGE_DIR = Path(__file__).parent.parent.parent / "storage" / "projects"
 
+# Latest saved version per (storage_dir, sanitized project, analysis_type),
+# filled lazily from a directory scan and bumped on every save
+_latest_versions: Dict[Tuple[str, str, str], int] = {}
+_latest_versions_lock = threading.Lock()
+
+# One lock per cache key, held only while versions are reserved, so saves to
+# different projects or types never wait on each other
+_version_locks: Dict[Tuple[str, str, str], threading.Lock] = defaultdict(threading.Lock)
+
+# Project directories already created (or found) by save_analysis in this
+# process, so repeated saves to a project skip the makedirs syscalls
+_existing_dirs: Set[str] = set()
+
+# Anything but letters, digits (str.isalnum), "_" and "-" becomes "_"
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w-]")
+_REPEATED_UNDERSCORES = re.compile(r"__+")
+
+# Analysis types accepted by save_analysis; "matrix" is the API's generic 2x2
+_VALID_TYPES = frozenset(
+    {
+        "hypothesis_tree",
+        "matrix",
+        "matrix_hypothesis_prioritization",
+        "matrix_risk_register",
+        "matrix_task_prioritization",
+        "matrix_measurement_priorities",
+        "research",
+    }
+)
+
+# Optional metadata index kept at the root of a storage directory
+INDEX_FILENAME = ".index.sqlite"
+
+# Index connection per storage directory, opened once the index is found and
+# only used while holding _index_lock
+_index_connections: Dict[str, sqlite3.Connection] = {}
+_index_lock = threading.Lock()
+
+logger = logging.getLogger("strategic_consultant.persistence")
+
+# Saved analysis filename: "{analysis_type}_v{version}.json"
+_ANALYSIS_FILENAME = re.compile(r"(?P<analysis_type>.+)_v(?P<version>\d+)\.json")
+
+# Files at least this large are memory-mapped on load instead of read into bytes
+_MMAP_MIN_SIZE = 64 * 1024
+
+# Write buffer for saved files; streamed saves flush in chunks of this size
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Permission bits for saved files: what open() would give them under the
+# umask in effect at import (mkstemp alone creates them owner-only)
+_umask = os.umask(0)
+os.umask(_umask)
+_NEW_FILE_MODE = 0o666 & ~_umask
+
+# os.link errors from filesystems without hard links; saves there fall back
+# to an exclusive create and copy
+_LINK_UNSUPPORTED_ERRNOS = frozenset(
+    {errno.EPERM, errno.ENOTSUP, errno.EOPNOTSUPP, errno.EXDEV}
+)
+
+# Storage paths are plain strings internally; helpers also accept Path
+_StrPath = Union[str, Path]
+
+
+@dataclass(frozen=True, slots=True)
+class ProjectPaths:
+    """Storage locations for one project, derived once per (dir, name)."""
+
+    base_dir: str
+    safe_project_name: str
+    project_dir: str
+
+
+@lru_cache(maxsize=256)
+def _paths(storage_dir: Optional[str], project_name: str) -> ProjectPaths:
+    """
+    Resolve the storage paths for a project.
+
+    Args:
+        storage_dir: Optional custom storage directory
+        project_name: Project name (sanitized here)
+
+    Returns:
+        ProjectPaths: Base directory, sanitized name and project directory,
+            as strings so hot paths join them without building Path objects
+    """
+    # Normalized through Path once, e.g. dropping a trailing separator
+    base_dir = os.fspath(Path(storage_dir) if storage_dir else DEFAULT_STORAGE_DIR)
+    safe_project_name = _sanitize_filename(project_name)
+    return ProjectPaths(
+        base_dir, safe_project_name, os.path.join(base_dir, safe_project_name)
+    )
+
+
+def _dumps(data: Dict, pretty: bool = False) -> bytes:
+    """
+    Encode data as UTF-8 JSON, using orjson when available.
+
+    Anything orjson refuses is encoded again with the stdlib, so it raises
+    the same TypeError or gives the same output as without orjson. That
+    covers datetimes and dataclasses, which orjson is told not to
+    serialize, and integers beyond 64 bits.
+
+    Differences that remain with orjson installed:
+    - NaN and Infinity are written as null; the stdlib writes the
+      non-standard NaN/Infinity tokens.
+    - UUIDs and Enum members are serialized instead of raising TypeError.
+    - Streamed saves always use the stdlib (see _iter_dumps).
+
+    Args:
+        data: JSON-serializable data
+        pretty: If True, indent with 2 spaces (default: compact)
+
+    Returns:
+        bytes: Encoded JSON
+    """
+    if orjson is not None:
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option)
+        except orjson.JSONEncodeError:
+            pass
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _iter_dumps(data: Dict, pretty: bool = False) -> Iterator[bytes]:
+    """
+    Encode data as UTF-8 JSON incrementally.
+
+    Uses the stdlib incremental encoder (orjson cannot stream), so the
+    full document is never held in memory at once.
+
+    Args:
+        data: JSON-serializable data
+        pretty: If True, indent with 2 spaces (default: compact)
+
+    Yields:
+        bytes: Consecutive pieces of the encoded JSON
+    """
+    if pretty:
+        encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+    else:
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    for chunk in encoder.iterencode(data):
+        yield chunk.encode("utf-8")
+
+
+def _loads(raw: Union[bytes, memoryview]) -> Dict:
+    """
+    Decode UTF-8 JSON, using orjson when available.
+
+    Documents orjson cannot parse, such as files with the NaN/Infinity
+    tokens the stdlib writes, are decoded again with the stdlib; a broken
+    file still raises json.JSONDecodeError. With orjson, integers beyond 64
+    bits load as floats.
+
+    Args:
+        raw: Encoded JSON (bytes, or a buffer when orjson is available)
+
+    Returns:
+        dict: Decoded data
+    """
+    data: Dict
+    if orjson is not None:
+        try:
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            data = json.loads(bytes(raw))
+    else:
+        data = json.loads(raw)
+    return data
+
+
+def _read_json_file(filepath: str) -> Dict:
+    """
+    Read and decode a saved analysis file.
+
+    Large files are memory-mapped and handed to orjson as a buffer, which
+    avoids copying the whole file into a bytes object first. Small files,
+    and every file when orjson is not installed (json.loads only accepts
+    str/bytes), are read normally.
+
+    Args:
+        filepath: Path to the JSON file
+
+    Returns:
+        dict: Decoded data
+    """
+    with open(filepath, "rb") as f:
+        if orjson is None or os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+            return _loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return _loads(view)
+
 
 def save_analysis(
     project_name: str,
     analysis_type: str,
     content: Dict,
     storage_dir: Optional[str] = None,
+    pretty: bool = False,
+    stream: bool = False,
+    durable: bool = False,
 ) -> Dict:
     """
     Persist analysis to JSON file for cross-session access.
 
+    The timestamp is an ISO 8601 string, both here and in the saved
+    metadata; the API and UI parse it as a date and older files use it too.
+
+    Versions continue from the highest version on disk, so saving after an
+    older version was deleted never overwrites a newer one.
+
     Args:
         project_name: Unique identifier for the project
-        analysis_type: One of [hypothesis_tree, matrix_hypothesis_prioritization,
-                        matrix_risk_register, matrix_task_prioritization,
-                        matrix_measurement_priorities, research]
+        analysis_type: One of [hypothesis_tree, matrix,
+                        matrix_hypothesis_prioritization, matrix_risk_register,
+                        matrix_task_prioritization, matrix_measurement_priorities,
+                        research]
         content: The analysis content to save
         storage_dir: Optional custom storage directory
+        pretty: If True, write indented JSON for manual inspection
+            (default: compact)
+        stream: If True, encode and write the file incrementally to cap
+            peak memory for very large content (default: encode in one go)
+        durable: If True, fsync the file and project directory so the save
+            survives a crash or power loss (default: leave it to the OS)
 
     Returns:
         dict: {"filepath": str, "version": int, "timestamp": str}
     """
+    return save_analysis_many(
+        project_name, analysis_type, [content], storage_dir, pretty, stream, durable
+    )[0]
+
+
+def save_analysis_many(
+    project_name: str,
+    analysis_type: str,
+    contents: List[Dict],
+    storage_dir: Optional[str] = None,
+    pretty: bool = False,
+    stream: bool = False,
+    durable: bool = False,
+) -> List[Dict]:
+    """
+    Persist several analyses of one type as consecutive versions.
+
+    Paths, the starting version and the index connection are resolved
+    once for the whole batch instead of once per save.
+
+    Args:
+        project_name: Unique identifier for the project
+        analysis_type: Analysis type (see save_analysis)
+        contents: Analysis contents to save, oldest first
+        storage_dir: Optional custom storage directory
+        pretty: If True, write indented JSON (default: compact)
+        stream: If True, encode and write each file incrementally
+        durable: If True, fsync every file, then the project directory once
+            for the whole batch
+
+    Returns:
+        list: One {"filepath": str, "version": int, "timestamp": str} per
+            content, in the same order
+    """
     # Validate analysis type
-    valid_types = [
-        "hypothesis_tree",
-        "matrix_hypothesis_prioritization",
-        "matrix_risk_register",
-        "matrix_task_prioritization",
-        "matrix_measurement_priorities",
-        "research",
-    ]
-    if analysis_type not in valid_types:
+    if analysis_type not in _VALID_TYPES:
         raise ValueError(
             f"Invalid analysis_type '{analysis_type}'. "
-            f"Must be one of: {valid_types}"
+            f"Must be one of: {sorted(_VALID_TYPES)}"
         )
 
-    # Sanitize project name for filesystem
-    safe_project_name = _sanitize_filename(project_name)
+    # Sanitized project name and storage directories
+    paths = _paths(storage_dir, project_name)
+    _ensure_dir(paths.project_dir)
 
-    # Determine storage directory
-    base_dir = Path(storage_dir) if storage_dir else DEFAULT_STORAGE_DIR
-    project_dir = base_dir / safe_project_name
-    project_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().isoformat()
+    results: List[Dict] = []
 
-    # Determine version number
-    existing_files = list(project_dir.glob(f"{analysis_type}_v*.json"))
-    version = len(existing_files) + 1
+    # Reserve the batch's versions up front; files are written without a lock
+    latest = _latest_version(paths, analysis_type, reserve=len(contents))
+    version = latest + 1
 
-    # Create filename
-    filename = f"{analysis_type}_v{version}.json"
-    filepath = project_dir / filename
+    try:
+        for content in contents:
+            version, filepath = _write_version(
+                paths,
+                project_name,
+                analysis_type,
+                version,
+                timestamp,
+                content,
+                pretty,
+                stream,
+                durable,
+            )
+            results.append(
+                {
+                    "filepath": filepath,
+                    "version": version,
+                    "timestamp": timestamp,
+                }
+            )
+            version += 1
+        if durable and results:
+            _fsync_dir(paths.project_dir)
+    finally:
+        _record_version(
+            paths,
+            analysis_type,
+            results[-1]["version"] if results else latest,
+            latest + len(contents),
+        )
 
-    # Create metadata
-    timestamp = datetime.now().isoformat()
-    metadata = {
-        "project_name": project_name,
-        "analysis_type": analysis_type,
-        "version": version,
-        "timestamp": timestamp,
-    }
+        # Index whatever was written, even if a later content failed. Rows
+        # carry the file modification time, like build_index and directory
+        # scans, and are only built (and stat'ed) when an index exists
+        _index_executemany(
+            paths.base_dir,
+            "INSERT OR REPLACE INTO analyses VALUES (?, ?, ?, ?, ?)",
+            (
+                (
+                    paths.safe_project_name,
+                    analysis_type,
+                    result["version"],
+                    result["filepath"],
+                    datetime.fromtimestamp(
+                        os.stat(result["filepath"]).st_mtime
+                    ).isoformat(),
+                )
+                for result in results
+            ),
+        )
 
-    # Combine metadata and content
-    save_data = {"metadata": metadata, "content": content}
+    return results
 
-    # Write to file
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(save_data, f, indent=2, ensure_ascii=False)
 
-    return {
-        "filepath": str(filepath),
-        "version": version,
-        "timestamp": timestamp,
-    }
+def _write_version(
+    paths: ProjectPaths,
+    project_name: str,
+    analysis_type: str,
+    version: int,
+    timestamp: str,
+    content: Dict,
+    pretty: bool,
+    stream: bool,
+    durable: bool,
+) -> Tuple[int, str]:
+    """
+    Write one analysis version, moving past versions saved elsewhere.
+
+    Args:
+        paths: Project storage paths
+        project_name: Project name as given by the caller
+        analysis_type: Analysis type
+        version: Version to try first
+        timestamp: ISO timestamp for the metadata
+        content: The analysis content to save
+        pretty: If True, write indented JSON
+        stream: If True, encode and write the file incrementally
+        durable: If True, fsync the file before it is linked into place
+
+    Returns:
+        tuple: (version actually written, path of the new file)
+    """
+    project_dir = paths.project_dir
+
+    while True:
+        # Create filename
+        filename = f"{analysis_type}_v{version}.json"
+        filepath = os.path.join(project_dir, filename)
+
+        # Create metadata
+        metadata = {
+            "project_name": project_name,
+            "analysis_type": analysis_type,
+            "version": version,
+            "timestamp": timestamp,
+        }
+
+        # Combine metadata and content
+        save_data = {"metadata": metadata, "content": content}
+
+        # Write to file, never overwriting an existing version
+        chunks: Iterable[bytes]
+        try:
+            if stream:
+                chunks = _iter_dumps(save_data, pretty)
+            else:
+                chunks = (_dumps(save_data, pretty),)
+            _write_new_file(filepath, chunks, durable)
+            return version, filepath
+        except FileExistsError:
+            # Another process saved since the cache was filled; rescan
+            version = _scan_latest_version(project_dir, analysis_type) + 1
+        except FileNotFoundError:
+            # Directory was removed behind our back; recreate and retry
+            _existing_dirs.discard(project_dir)
+            _ensure_dir(project_dir)
+
+
+def _fsync_dir(directory: str) -> None:
+    """
+    Flush a directory's entries (new links and removed temp files) to disk.
+
+    Args:
+        directory: Directory to sync
+    """
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _ensure_dir(directory: str) -> None:
+    """
+    Create a directory and its parents, once per process.
+
+    Args:
+        directory: Directory to create
+    """
+    if directory not in _existing_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _existing_dirs.add(directory)
+
+
+def _write_new_file(
+    filepath: str, chunks: Iterable[bytes], durable: bool = False
+) -> None:
+    """
+    Atomically create a file, failing if it already exists.
+
+    The data is written to a temp file in the same directory and then
+    hard-linked into place, so readers never see a partial file and an
+    existing file is never replaced. On filesystems without hard links the
+    temp file is copied into an exclusively created file instead, which
+    still never replaces a file but may be read while it is being copied.
+
+    Args:
+        filepath: Destination path
+        chunks: File contents, written in order
+        durable: If True, fsync the contents before linking
+
+    Raises:
+        FileExistsError: If filepath already exists
+    """
+    directory, filename = os.path.split(filepath)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{filename}.", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "wb", buffering=_WRITE_BUFFER_SIZE) as f:
+            f.writelines(chunks)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.chmod(tmp_path, _NEW_FILE_MODE)
+        try:
+            os.link(tmp_path, filepath)
+        except OSError as e:
+            if e.errno not in _LINK_UNSUPPORTED_ERRNOS:
+                raise
+            _copy_to_new_file(tmp_path, filepath, durable)
+    finally:
+        os.unlink(tmp_path)
+
+
+def _copy_to_new_file(src_path: str, filepath: str, durable: bool) -> None:
+    """
+    Copy a file into a newly created file, failing if it already exists.
+
+    Args:
+        src_path: File to copy
+        filepath: Destination path
+        durable: If True, fsync the copy
+
+    Raises:
+        FileExistsError: If filepath already exists
+    """
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as dst, open(src_path, "rb") as src:
+            shutil.copyfileobj(src, dst, _WRITE_BUFFER_SIZE)
+            if durable:
+                dst.flush()
+                os.fsync(dst.fileno())
+    except BaseException:
+        # Never leave a partial copy where a later save would skip its version
+        os.unlink(filepath)
+        raise
 
 
 def load_analysis(
@@ -103,52 +550,43 @@ def load_analysis(
     Returns:
         dict: Saved analysis content with metadata
     """
-    # Sanitize project name
-    safe_project_name = _sanitize_filename(project_name)
-
-    # Determine storage directory
-    base_dir = Path(storage_dir) if storage_dir else DEFAULT_STORAGE_DIR
-    project_dir = base_dir / safe_project_name
-
-    # Check if project directory exists
-    if not project_dir.exists():
-        raise FileNotFoundError(f"No saved analyses found for project '{project_name}'")
+    # Sanitized project name and storage directories
+    paths = _paths(storage_dir, project_name)
+    project_dir = paths.project_dir
+    missing_project = f"No saved analyses found for project '{project_name}'"
 
     # If no analysis_type specified, list all available
     if analysis_type is None:
+        if not os.path.isdir(project_dir):
+            raise FileNotFoundError(missing_project)
         return _list_project_analyses(project_dir, project_name)
 
-    # Find matching files
-    if version is not None:
-        # Load specific version
-        filename = f"{analysis_type}_v{version}.json"
-        filepath = project_dir / filename
-
-        if not filepath.exists():
-            raise FileNotFoundError(
-                f"Analysis '{analysis_type}' version {version} "
-                f"not found for project '{project_name}'"
-            )
-    else:
-        # Load latest version
-        matching_files = sorted(
-            project_dir.glob(f"{analysis_type}_v*.json"), reverse=True
-        )
-
-        if not matching_files:
+    # Resolve the version; missing files are only diagnosed on the error path
+    if version is None:
+        # Load latest version (compared numerically, so v10 follows v9)
+        version = _scan_latest_version(project_dir, analysis_type)
+        if not version:
+            if not os.path.isdir(project_dir):
+                raise FileNotFoundError(missing_project)
             raise FileNotFoundError(
                 f"No '{analysis_type}' analyses found for project '{project_name}'"
             )
 
-        filepath = matching_files[0]
+    filepath = os.path.join(project_dir, f"{analysis_type}_v{version}.json")
 
-    # Load and return
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    return data
+    # Load and return; open() itself reports a missing file
+    try:
+        return _read_json_file(filepath)
+    except FileNotFoundError:
+        if not os.path.isdir(project_dir):
+            raise FileNotFoundError(missing_project) from None
+        raise FileNotFoundError(
+            f"Analysis '{analysis_type}' version {version} "
+            f"not found for project '{project_name}'"
+        ) from None
 
 
+@lru_cache(maxsize=1024)
 def _sanitize_filename(name: str) -> str:
     """
     Sanitize a string for use as a filename.
@@ -160,11 +598,10 @@ def _sanitize_filename(name: str) -> str:
         str: Sanitized filename
     """
     # Replace spaces and special characters with underscores
-    safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in name)
+    safe_name = _UNSAFE_FILENAME_CHARS.sub("_", name)
 
     # Remove consecutive underscores
-    while "__" in safe_name:
-        safe_name = safe_name.replace("__", "_")
+    safe_name = _REPEATED_UNDERSCORES.sub("_", safe_name)
 
     # Remove leading/trailing underscores
     safe_name = safe_name.strip("_")
@@ -173,16 +610,17 @@ def _sanitize_filename(name: str) -> str:
     safe_name = safe_name.lower()
 
     # Limit length
-    if len(safe_name) > 100:
-        safe_name = safe_name[:100]
-
-    return safe_name
+    return safe_name[:100]
 
 
-def _list_project_analyses(project_dir: Path, project_name: str) -> Dict:
+def _list_project_analyses(project_dir: _StrPath, project_name: str) -> Dict:
     """
     List all analyses for a project.
 
+    Rows come from the storage index when one exists, otherwise from the
+    filenames, so no saved file is opened or parsed. Either way the
+    timestamp is the file modification time.
+
     Args:
         project_dir: Path to project directory
         project_name: Project name
@@ -190,53 +628,201 @@ def _list_project_analyses(project_dir: Path, project_name: str) -> Dict:
     Returns:
         dict: Summary of available analyses
     """
-    analyses = {}
+    analyses = defaultdict(list)
+
+    # The index walks its primary key backwards, so rows arrive newest first
+    rows = _index_query(
+        os.path.dirname(project_dir),
+        "SELECT analysis_type, version, timestamp, filepath FROM analyses "
+        "WHERE project = ? ORDER BY analysis_type DESC, version DESC",
+        (os.path.basename(project_dir),),
+    )
+    if rows is None:
+        rows = _scan_project_analyses(project_dir)
+        # Sort by version (descending) once, before grouping by type
+        rows.sort(key=itemgetter(1), reverse=True)
+
+    for analysis_type, version, timestamp, filepath in rows:
+        analyses[analysis_type].append(
+            {"version": version, "timestamp": timestamp, "filepath": filepath}
+        )
 
-    # Find all JSON files
-    all_files = list(project_dir.glob("*.json"))
+    return {
+        "project_name": project_name,
+        "analyses": dict(analyses),
+        "total_count": sum(len(versions) for versions in analyses.values()),
+    }
 
-    for filepath in all_files:
-        # Parse filename
-        stem = filepath.stem  # e.g., "hypothesis_tree_v1"
 
-        # Extract analysis type and version
-        if "_v" in stem:
-            parts = stem.rsplit("_v", 1)
-            if len(parts) == 2:
-                analysis_type = parts[0]
-                try:
-                    version = int(parts[1])
+def _scan_project_analyses(
+    project_dir: _StrPath,
+) -> List[Tuple[str, int, str, str]]:
+    """
+    Scan a project directory for saved analysis files.
 
-                    # Initialize type list if needed
-                    if analysis_type not in analyses:
-                        analyses[analysis_type] = []
+    Args:
+        project_dir: Path to project directory
 
-                    # Load metadata
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        data = json.load(f)
+    Returns:
+        list: (analysis_type, version, timestamp, filepath) per saved file
+    """
+    rows = []
 
-                    metadata = data.get("metadata", {})
+    with os.scandir(project_dir) as entries:
+        for entry in entries:
+            # e.g., "hypothesis_tree_v1.json"
+            match = _ANALYSIS_FILENAME.fullmatch(entry.name)
+            if match is None or not entry.is_file():
+                continue
 
-                    analyses[analysis_type].append(
-                        {
-                            "version": version,
-                            "timestamp": metadata.get("timestamp"),
-                            "filepath": str(filepath),
-                        }
-                    )
-                except (ValueError, json.JSONDecodeError):
-                    # Skip malformed files
-                    continue
+            timestamp = datetime.fromtimestamp(entry.stat().st_mtime).isoformat()
+            rows.append(
+                (match["analysis_type"], int(match["version"]), timestamp, entry.path)
+            )
 
-    # Sort by version (descending)
-    for analysis_type in analyses:
-        analyses[analysis_type].sort(key=lambda x: x["version"], reverse=True)
+    return rows
 
-    return {
-        "project_name": project_name,
-        "analyses": analyses,
-        "total_count": sum(len(versions) for versions in analyses.values()),
-    }
+
+def build_index(storage_dir: Optional[str] = None) -> Dict:
+    """
+    Create (or rebuild) the SQLite metadata index for a storage directory.
+
+    Once the index exists, saves and deletes keep it up to date, and
+    version lookups and project listings query it instead of scanning
+    directories. Each row's timestamp is the file modification time, the
+    same as a directory scan reports.
+
+    Args:
+        storage_dir: Optional custom storage directory
+
+    Returns:
+        dict: {"index_path": str, "indexed": int}
+    """
+    base_dir = Path(storage_dir) if storage_dir else DEFAULT_STORAGE_DIR
+    base_dir.mkdir(parents=True, exist_ok=True)
+    index_path = base_dir / INDEX_FILENAME
+
+    # (project, analysis_type, version, timestamp, filepath) per saved file
+    rows: List[Tuple[str, str, int, str, str]] = []
+    with os.scandir(base_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                rows.extend(
+                    (entry.name, *row) for row in _scan_project_analyses(entry.path)
+                )
+
+    with closing(sqlite3.connect(index_path)) as conn, conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS analyses ("
+            "project TEXT NOT NULL, analysis_type TEXT NOT NULL, "
+            "version INTEGER NOT NULL, filepath TEXT NOT NULL, timestamp TEXT, "
+            "PRIMARY KEY (project, analysis_type, version))"
+        )
+        conn.execute("DELETE FROM analyses")
+        conn.executemany(
+            "INSERT INTO analyses (project, analysis_type, version, timestamp, "
+            "filepath) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+
+    # Cached versions may predate the index; let the next lookup query it
+    _forget_latest_versions(base_dir)
+    with _index_lock:
+        stale = _index_connections.pop(os.fspath(base_dir), None)
+        if stale is not None:
+            stale.close()
+
+    return {"index_path": str(index_path), "indexed": len(rows)}
+
+
+def _connect_index(base_dir: _StrPath) -> Optional[sqlite3.Connection]:
+    """
+    Get the storage index connection, opening it on first use.
+
+    Until the index is found, every call checks for the file, so an index
+    another process builds is picked up by the next save or lookup here.
+    Once opened, the connection is reused. Callers must hold _index_lock.
+
+    Args:
+        base_dir: Storage directory
+
+    Returns:
+        sqlite3.Connection or None: Connection, or None without an index
+    """
+    base_dir = os.fspath(base_dir)
+    conn = _index_connections.get(base_dir)
+    if conn is not None:
+        return conn
+
+    index_path = os.path.join(base_dir, INDEX_FILENAME)
+    if not os.path.isfile(index_path):
+        return None
+    conn = sqlite3.connect(index_path, check_same_thread=False)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    _index_connections[base_dir] = conn
+    return conn
+
+
+def _index_query(base_dir: _StrPath, sql: str, params: Tuple) -> Optional[List[Tuple]]:
+    """
+    Run a read query against the storage index.
+
+    Args:
+        base_dir: Storage directory
+        sql: SELECT statement
+        params: Statement parameters
+
+    Returns:
+        list or None: Result rows, or None if there is no index or the
+            query failed (callers then scan the directory)
+    """
+    with _index_lock:
+        conn = _connect_index(base_dir)
+        if conn is None:
+            return None
+        try:
+            return conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Index query failed in {base_dir}: {e}")
+            return None
+
+
+def _index_execute(base_dir: _StrPath, sql: str, params: Tuple) -> None:
+    """
+    Run a write statement against the storage index, if one exists.
+
+    Args:
+        base_dir: Storage directory
+        sql: INSERT/DELETE statement
+        params: Statement parameters
+    """
+    _index_executemany(base_dir, sql, [params])
+
+
+def _index_executemany(base_dir: _StrPath, sql: str, rows: Iterable[Tuple]) -> None:
+    """
+    Run a write statement once per row in a single index transaction.
+
+    Errors are logged, not raised: the files are already saved or deleted
+    by the time the index is updated, and build_index can resync it.
+
+    Args:
+        base_dir: Storage directory
+        sql: INSERT/DELETE statement
+        rows: Parameters for each execution
+    """
+    if not rows:
+        return
+    with _index_lock:
+        conn = _connect_index(base_dir)
+        if conn is None:
+            return
+        try:
+            with conn:
+                conn.executemany(sql, rows)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Index update failed in {base_dir}: {e}")
 
 
 def delete_analysis(
@@ -257,27 +843,31 @@ def delete_analysis(
     Returns:
         dict: {"deleted": bool, "filepath": str}
     """
-    # Sanitize project name
-    safe_project_name = _sanitize_filename(project_name)
-
-    # Determine storage directory
-    base_dir = Path(storage_dir) if storage_dir else DEFAULT_STORAGE_DIR
-    project_dir = base_dir / safe_project_name
+    # Sanitized project name and storage directories
+    paths = _paths(storage_dir, project_name)
+    project_dir = paths.project_dir
 
     # Build filepath
     filename = f"{analysis_type}_v{version}.json"
-    filepath = project_dir / filename
+    filepath = os.path.join(project_dir, filename)
 
-    if not filepath.exists():
+    # Delete file; os.remove itself reports a missing file
+    try:
+        os.remove(filepath)
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Analysis '{analysis_type}' version {version} "
             f"not found for project '{project_name}'"
-        )
-
-    # Delete file
-    os.remove(filepath)
+        ) from None
+    _forget_latest_versions(paths.base_dir, paths.safe_project_name, analysis_type)
+    _index_execute(
+        paths.base_dir,
+        "DELETE FROM analyses "
+        "WHERE project = ? AND analysis_type = ? AND version = ?",
+        (paths.safe_project_name, analysis_type, version),
+    )
 
-    return {"deleted": True, "filepath": str(filepath)}
+    return {"deleted": True, "filepath": filepath}
 
 
 def delete_project(
@@ -296,12 +886,9 @@ def delete_project(
     """
     import shutil
 
-    # Sanitize project name
-    safe_project_name = _sanitize_filename(project_name)
-
-    # Determine storage directory
-    base_dir = Path(storage_dir) if storage_dir else DEFAULT_STORAGE_DIR
-    project_dir = base_dir / safe_project_name
+    # Sanitized project name and storage directories
+    paths = _paths(storage_dir, project_name)
+    project_dir = Path(paths.project_dir)
 
     if not project_dir.exists():
         raise FileNotFoundError(
@@ -313,6 +900,13 @@ def delete_project(
 
     # Delete entire project directory
     shutil.rmtree(project_dir)
+    _existing_dirs.discard(paths.project_dir)
+    _forget_latest_versions(paths.base_dir, paths.safe_project_name)
+    _index_execute(
+        paths.base_dir,
+        "DELETE FROM analyses WHERE project = ?",
+        (paths.safe_project_name,),
+    )
 
     return {
         "deleted": True,
@@ -335,34 +929,148 @@ def get_latest_version(
     Returns:
         int: Latest version number (0 if none exist)
     """
-    # Sanitize project name
-    safe_project_name = _sanitize_filename(project_name)
+    # Sanitized project name and storage directories
+    paths = _paths(storage_dir, project_name)
 
-    # Determine storage directory
-    base_dir = Path(storage_dir) if storage_dir else DEFAULT_STORAGE_DIR
-    project_dir = base_dir / safe_project_name
+    return _latest_version(paths, analysis_type)
 
-    if not project_dir.exists():
-        return 0
 
-    # Find matching files
-    matching_files = list(project_dir.glob(f"{analysis_type}_v*.json"))
+def _latest_version(paths: ProjectPaths, analysis_type: str, reserve: int = 0) -> int:
+    """
+    Get the cached latest version, optionally reserving versions after it.
+
+    Only the first call per project and type looks at the index or the
+    directory. The lock is per project and type, so this never waits on
+    saves elsewhere.
+
+    Args:
+        paths: Project storage paths
+        analysis_type: Analysis type
+        reserve: Number of versions to reserve after the latest one
+
+    Returns:
+        int: Latest version before the reservation (0 if none exist)
+    """
+    cache_key = (paths.base_dir, paths.safe_project_name, analysis_type)
+    with _version_lock(cache_key):
+        latest = _latest_versions.get(cache_key)
+        if latest is None:
+            latest = _stored_latest_version(paths, analysis_type)
+        with _latest_versions_lock:
+            _latest_versions[cache_key] = latest + reserve
+
+    return latest
+
+
+def _record_version(
+    paths: ProjectPaths, analysis_type: str, version: int, reserved: int
+) -> None:
+    """
+    Settle the cached latest version once a batch of saves is done.
+
+    Versions a failed batch reserved but never wrote are given back, unless
+    a later save has reserved versions after them. A batch that moved past
+    versions written elsewhere raises the cache to the version it wrote.
+
+    Args:
+        paths: Project storage paths
+        analysis_type: Analysis type
+        version: Highest version written to disk, or the latest version
+            before the reservation if nothing was written
+        reserved: Highest version the batch reserved
+    """
+    cache_key = (paths.base_dir, paths.safe_project_name, analysis_type)
+    with _version_lock(cache_key):
+        latest = _latest_versions.get(cache_key, 0)
+        if latest == reserved or latest < version:
+            with _latest_versions_lock:
+                _latest_versions[cache_key] = version
 
-    if not matching_files:
+
+def _version_lock(cache_key: Tuple[str, str, str]) -> threading.Lock:
+    """
+    Get the lock that guards version reservations for one cache key.
+
+    Args:
+        cache_key: (storage_dir, sanitized project, analysis_type)
+
+    Returns:
+        threading.Lock: Lock shared by every save to that key
+    """
+    with _latest_versions_lock:
+        return _version_locks[cache_key]
+
+
+def _scan_latest_version(project_dir: _StrPath, analysis_type: str) -> int:
+    """
+    Find the highest saved version of an analysis type on disk.
+
+    Only filenames are inspected; no file is opened or parsed.
+
+    Args:
+        project_dir: Path to project directory
+        analysis_type: Analysis type
+
+    Returns:
+        int: Latest version number (0 if none exist)
+    """
+    latest = 0
+
+    try:
+        with os.scandir(project_dir) as entries:
+            for entry in entries:
+                # e.g., "hypothesis_tree_v1.json"
+                match = _ANALYSIS_FILENAME.fullmatch(entry.name)
+                if match is not None and match["analysis_type"] == analysis_type:
+                    latest = max(latest, int(match["version"]))
+    except FileNotFoundError:
         return 0
 
-    # Extract version numbers
-    versions = []
-    for filepath in matching_files:
-        stem = filepath.stem
-        if "_v" in stem:
-            version_str = stem.rsplit("_v", 1)[1]
-            try:
-                versions.append(int(version_str))
-            except ValueError:
-                continue
+    return latest
+
+
+def _stored_latest_version(paths: ProjectPaths, analysis_type: str) -> int:
+    """
+    Look up the latest version in the index, or scan the directory without one.
+
+    Args:
+        paths: Project storage paths
+        analysis_type: Analysis type
+
+    Returns:
+        int: Latest version number (0 if none exist)
+    """
+    rows = _index_query(
+        paths.base_dir,
+        "SELECT MAX(version) FROM analyses WHERE project = ? AND analysis_type = ?",
+        (paths.safe_project_name, analysis_type),
+    )
+    if rows is not None:
+        return rows[0][0] or 0
+    return _scan_latest_version(paths.project_dir, analysis_type)
+
 
-    return max(versions) if versions else 0
+def _forget_latest_versions(
+    base_dir: _StrPath,
+    safe_project_name: Optional[str] = None,
+    analysis_type: Optional[str] = None,
+) -> None:
+    """
+    Drop cached latest versions after files are deleted.
+
+    Args:
+        base_dir: Storage directory
+        safe_project_name: Sanitized project name (default: all projects)
+        analysis_type: Analysis type to forget (default: all types)
+    """
+    with _latest_versions_lock:
+        for key in list(_latest_versions):
+            if (
+                key[0] == str(base_dir)
+                and safe_project_name in (None, key[1])
+                and analysis_type in (None, key[2])
+            ):
+                del _latest_versions[key]
 
 
 # Matrix-specific convenience functions
@@ -0,0 +1,63 @@
+"""Shared pytest configuration and fixtures."""
+
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from tests.paths import EVALSET_PATH, TEST_CONFIG_PATH
+
+
+def _read_json(path: Path):
+    """Parse a JSON file, returning the exception instead of raising it."""
+    try:
+        return json.loads(path.read_bytes())
+    except (OSError, ValueError) as e:
+        return e
+
+
+def pytest_configure(config):
+    """Load the read-only evaluation files once per process (once per worker)."""
+    config._evalset = _read_json(EVALSET_PATH)
+    config._test_config = _read_json(TEST_CONFIG_PATH)
+
+
+def _loaded(value, name: str):
+    """Return a file parsed at configure time, failing the test if it did not load."""
+    if isinstance(value, Exception):
+        pytest.fail(f"Could not load {name}: {value}")
+    return value
+
+
+@pytest.fixture(scope="session")
+def evalset(request):
+    """Parsed evalset, loaded once at configure time."""
+    return _loaded(request.config._evalset, "evalset.json")
+
+
+@pytest.fixture(scope="session")
+def test_config(request):
+    """Parsed test config, loaded once at configure time."""
+    return _loaded(request.config._test_config, "test_config.json")
+
+
+def _empty_run(*args, **kwargs):
+    """Stand-in for InMemoryRunner.run: a fresh, lazy generator of no events."""
+    yield from ()
+
+
+@pytest.fixture(scope="session")
+def _runner_spec():
+    """InMemoryRunner attribute names, introspected once per session."""
+    from google.adk.runners import InMemoryRunner
+
+    return dir(InMemoryRunner)
+
+
+@pytest.fixture
+def runner_mock(_runner_spec):
+    """Fresh InMemoryRunner-shaped mock whose run() yields no events."""
+    mock = MagicMock(spec=_runner_spec)
+    mock.run = MagicMock(side_effect=_empty_run)
+    return mock
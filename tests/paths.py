@@ -0,0 +1,8 @@
+"""File paths shared by the test suite and its conftest."""
+
+from pathlib import Path
+
+# Evaluation files, resolved relative to the repo root (independent of CWD)
+EVALUATION_DIR = Path(__file__).resolve().parent.parent / "evaluation"
+EVALSET_PATH = EVALUATION_DIR / "strategic_consultant.evalset.json"
+TEST_CONFIG_PATH = EVALUATION_DIR / "test_config.json"
@@ -4,7 +4,7 @@ import json
 import os
 import tempfile
 from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -355,45 +355,45 @@ class TestListSavedAnalyses:
 class TestIntegrationWorkflow:
     """Test complete save/load workflow."""
 
-    @patch("strategic_consultant_agent.persistence_integration.save_analysis")
-    @patch("strategic_consultant_agent.persistence_integration.load_analysis")
-    def test_complete_workflow(
-        self,
-        mock_load,
-        mock_save,
-        sample_hypothesis_tree,
-        sample_priority_matrix,
-    ):
+    def test_complete_workflow(self, sample_hypothesis_tree, sample_priority_matrix):
         """Test complete save and load workflow."""
-        # Save analysis
-        mock_save.return_value = {
-            "filepath": "storage/projects/test_v1.json",
-            "version": 1,
-        }
+        mock_save = MagicMock()
+        mock_load = MagicMock()
+
+        with patch.multiple(
+            "strategic_consultant_agent.persistence_integration",
+            save_analysis=mock_save,
+            load_analysis=mock_load,
+        ):
+            # Save analysis
+            mock_save.return_value = {
+                "filepath": "storage/projects/test_v1.json",
+                "version": 1,
+            }
 
-        save_result = save_completed_analysis(
-            project_name="test",
-            hypothesis_tree=sample_hypothesis_tree,
-            priority_matrix=sample_priority_matrix,
-            market_research="Market data",
-        )
+            save_result = save_completed_analysis(
+                project_name="test",
+                hypothesis_tree=sample_hypothesis_tree,
+                priority_matrix=sample_priority_matrix,
+                market_research="Market data",
+            )
 
-        assert save_result["version"] == 1
+            assert save_result["version"] == 1
 
-        # Load analysis
-        saved_data = {
-            "hypothesis_tree": sample_hypothesis_tree,
-            "priority_matrix": sample_priority_matrix,
-            "market_research": "Market data",
-            "metadata": {
-                "timestamp": "2025-11-23T10:00:00",
-                "framework_used": "scale_decision",
-            },
-        }
+            # Load analysis
+            saved_data = {
+                "hypothesis_tree": sample_hypothesis_tree,
+                "priority_matrix": sample_priority_matrix,
+                "market_research": "Market data",
+                "metadata": {
+                    "timestamp": "2025-11-23T10:00:00",
+                    "framework_used": "scale_decision",
+                },
+            }
 
-        mock_load.return_value = saved_data
+            mock_load.return_value = saved_data
 
-        loaded = load_previous_analysis("test")
+            loaded = load_previous_analysis("test")
 
         tree = extract_hypothesis_tree(loaded)
         matrix = extract_priority_matrix(loaded)
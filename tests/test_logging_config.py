@@ -1,7 +1,6 @@
 """Tests for logging configuration."""
 
 import logging
-import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -17,6 +16,47 @@ from strategic_consultant_agent.logging_config import (
     get_logger,
 )
 
+# Loggers whose handlers tests replace or clear
+_ISOLATED_LOGGERS = ("strategic_consultant", "test_strategic_consultant")
+
+
+@pytest.fixture(autouse=True)
+def _restore_logger_handlers():
+    """Restore shared loggers' handlers so tests can run in any order."""
+    saved = {}
+    for name in _ISOLATED_LOGGERS:
+        logger = logging.getLogger(name)
+        saved[name] = (list(logger.handlers), logger.level)
+    yield
+    for name, (handlers, level) in saved.items():
+        logger = logging.getLogger(name)
+        for handler in logger.handlers:
+            if handler not in handlers:
+                handler.close()
+        logger.handlers = handlers
+        logger.setLevel(level)
+
+
+class _SpyFileHandler(logging.Handler):
+    """Stand-in for logging.FileHandler that records the filename without I/O."""
+
+    def __init__(self, filename, *args, **kwargs):
+        super().__init__()
+        self.baseFilename = str(filename)
+
+    def emit(self, record):
+        pass
+
+
+@pytest.fixture
+def spy_file_handler(monkeypatch):
+    """Replace FileHandler in logging_config so no log file is opened."""
+    monkeypatch.setattr(
+        "strategic_consultant_agent.logging_config.logging.FileHandler",
+        _SpyFileHandler,
+    )
+    return _SpyFileHandler
+
 
 class TestSetupLogging:
     """Test logging setup."""
@@ -29,25 +69,19 @@ class TestSetupLogging:
         assert len(logger.handlers) == 1
         assert isinstance(logger.handlers[0], logging.StreamHandler)
 
-    def test_setup_file_only(self):
+    def test_setup_file_only(self, tmp_path, spy_file_handler):
         """Test setting up file logging only."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            logger = setup_logging(
-                log_to_file=True, log_to_console=False, log_dir=Path(tmpdir)
-            )
+        logger = setup_logging(log_to_file=True, log_to_console=False, log_dir=tmp_path)
 
-            assert logger.name == "strategic_consultant"
-            assert len(logger.handlers) == 1
-            assert isinstance(logger.handlers[0], logging.FileHandler)
+        assert logger.name == "strategic_consultant"
+        assert len(logger.handlers) == 1
+        assert isinstance(logger.handlers[0], spy_file_handler)
 
-    def test_setup_both_handlers(self):
+    def test_setup_both_handlers(self, tmp_path, spy_file_handler):
         """Test setting up both console and file logging."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            logger = setup_logging(
-                log_to_file=True, log_to_console=True, log_dir=Path(tmpdir)
-            )
+        logger = setup_logging(log_to_file=True, log_to_console=True, log_dir=tmp_path)
 
-            assert len(logger.handlers) == 2
+        assert len(logger.handlers) == 2
 
     def test_log_level_setting(self):
         """Test that log level is set correctly."""
@@ -55,14 +89,14 @@ class TestSetupLogging:
 
         assert logger.level == logging.DEBUG
 
-    def test_log_file_created(self):
-        """Test that log file is created."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            setup_logging(log_to_file=True, log_to_console=False, log_dir=Path(tmpdir))
+    def test_log_file_created(self, tmp_path, spy_file_handler):
+        """Test that the file handler targets a strategic_consultant log file."""
+        logger = setup_logging(log_to_file=True, log_to_console=False, log_dir=tmp_path)
 
-            log_files = list(Path(tmpdir).glob("*.log"))
-            assert len(log_files) == 1
-            assert log_files[0].name.startswith("strategic_consultant_")
+        log_file = Path(logger.handlers[0].baseFilename)
+        assert log_file.parent == tmp_path
+        assert log_file.name.startswith("strategic_consultant_")
+        assert log_file.suffix == ".log"
 
 
 class TestLogToolCall:
@@ -234,7 +268,7 @@ class TestGetLogger:
 
     def test_get_logger_creates_if_missing(self):
         """Test that get_logger creates logger if not exists."""
-        # Clean up any existing handlers
+        # Clear handlers; the autouse fixture restores them afterwards
         logger = logging.getLogger("test_strategic_consultant")
         logger.handlers = []
 
@@ -254,52 +288,54 @@ class TestGetLogger:
 class TestIntegration:
     """Test integrated logging scenarios."""
 
-    def test_complete_workflow_logging(self):
+    def test_complete_workflow_logging(self, caplog):
         """Test logging throughout a complete workflow."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            logger = setup_logging(
-                log_level="DEBUG",
-                log_to_file=True,
-                log_to_console=False,
-                log_dir=Path(tmpdir),
-            )
-
-            # Log session start
-            log_session_event(
-                logger,
-                event_type="START",
-                session_id="test_session",
-                details={"question": "Should we scale?"},
-            )
-
-            # Log tool call
-            log_tool_call(
-                logger,
-                tool_name="generate_hypothesis_tree",
-                parameters={"framework": "scale_decision"},
-                result={"L1_DESIRABILITY": {}},
-            )
-
-            # Log agent transition
-            log_agent_transition(
-                logger,
-                from_agent="research_phase",
-                to_agent="analysis_phase",
-                state_keys=["market_research"],
-            )
-
-            # Log loop iteration
-            log_loop_iteration(
-                logger, loop_name="analysis_phase", iteration=1, max_iterations=3
-            )
-
-            # Log validation
-            log_validation_result(logger, validator_name="MECE", is_valid=True)
-
-            # Verify log file exists and has content
-            log_files = list(Path(tmpdir).glob("*.log"))
-            assert len(log_files) == 1
-            assert log_files[0].stat().st_size > 0
+        logger = setup_logging(
+            log_level="DEBUG",
+            log_to_file=False,
+            log_to_console=False,
+        )
+
+        # Log session start
+        log_session_event(
+            logger,
+            event_type="START",
+            session_id="test_session",
+            details={"question": "Should we scale?"},
+        )
+
+        # Log tool call
+        log_tool_call(
+            logger,
+            tool_name="generate_hypothesis_tree",
+            parameters={"framework": "scale_decision"},
+            result={"L1_DESIRABILITY": {}},
+        )
+
+        # Log agent transition
+        log_agent_transition(
+            logger,
+            from_agent="research_phase",
+            to_agent="analysis_phase",
+            state_keys=["market_research"],
+        )
+
+        # Log loop iteration
+        log_loop_iteration(
+            logger, loop_name="analysis_phase", iteration=1, max_iterations=3
+        )
+
+        # Log validation
+        log_validation_result(logger, validator_name="MECE", is_valid=True)
+
+        # Verify every workflow step was recorded (captured in memory, no disk I/O)
+        records = [r for r in caplog.records if r.name == "strategic_consultant"]
+        assert len(records) == 5
+        assert "START" in records[0].getMessage()
+        assert "SUCCESS" in records[1].getMessage()
+        assert "research_phase" in records[2].getMessage()
+        assert "[1/3]" in records[3].getMessage()
+        assert "PASSED" in records[4].getMessage()
 
     def test_error_logging(self):
         """Test logging errors."""
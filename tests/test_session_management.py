@@ -1,33 +1,51 @@
 """Tests for session management functionality."""
 
+import threading
+import time
+from collections import deque
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
 import pytest
-from unittest.mock import MagicMock, patch
 
+from strategic_consultant_agent import session_manager
 from strategic_consultant_agent.session_manager import (
+    SessionPool,
     StrategicConsultantSession,
     create_runner,
     run_analysis,
 )
 
+# Very long question, built once at import
+_LONG_INPUT = "Should we scale? " * 1000
+
+
+@pytest.fixture(autouse=True)
+def sm_mocks(monkeypatch):
+    """Replace the ADK runner and agent factory used by session_manager."""
+    runner_cls = MagicMock()
+    agent_fn = MagicMock()
+    monkeypatch.setattr(session_manager, "InMemoryRunner", runner_cls)
+    monkeypatch.setattr(session_manager, "create_strategic_analyzer", agent_fn)
+    session_manager._cached_analyzer.cache_clear()
+    yield SimpleNamespace(runner_cls=runner_cls, agent_fn=agent_fn)
+    session_manager._cached_analyzer.cache_clear()
+
 
 class TestStrategicConsultantSession:
     """Test StrategicConsultantSession class."""
 
-    @patch("strategic_consultant_agent.session_manager.InMemoryRunner")
-    @patch("strategic_consultant_agent.session_manager.create_strategic_analyzer")
-    def test_initialization(self, mock_create_agent, mock_runner):
+    def test_initialization(self, sm_mocks):
         """Test session initialization with default values."""
         session = StrategicConsultantSession()
 
         assert session.session_id == "default_session"
         assert session.user_id == "default_user"
         assert session.app_name == "strategic_consultant"
-        mock_create_agent.assert_called_once()
-        mock_runner.assert_called_once()
+        sm_mocks.agent_fn.assert_called_once()
+        sm_mocks.runner_cls.assert_called_once()
 
-    @patch("strategic_consultant_agent.session_manager.InMemoryRunner")
-    @patch("strategic_consultant_agent.session_manager.create_strategic_analyzer")
-    def test_initialization_with_custom_ids(self, mock_create_agent, mock_runner):
+    def test_initialization_with_custom_ids(self):
         """Test session initialization with custom IDs."""
         session = StrategicConsultantSession(
             user_id="user123", session_id="session456", app_name="test_app"
@@ -37,34 +55,34 @@ class TestStrategicConsultantSession:
         assert session.user_id == "user123"
         assert session.app_name == "test_app"
 
-    @patch("strategic_consultant_agent.session_manager.InMemoryRunner")
-    @patch("strategic_consultant_agent.session_manager.create_strategic_analyzer")
-    def test_run_creates_message(self, mock_create_agent, mock_runner):
+    def test_run_creates_message(self, sm_mocks, runner_mock):
         """Test that run creates proper message content."""
-        mock_runner_instance = MagicMock()
-        mock_runner_instance.run = MagicMock(return_value=iter([]))
-        mock_runner.return_value = mock_runner_instance
+        sm_mocks.runner_cls.return_value = runner_mock
 
         session = StrategicConsultantSession()
         list(session.run("Should we scale fall detection?"))
 
         # Verify run was called with correct parameters
-        mock_runner_instance.run.assert_called_once()
-        call_args = mock_runner_instance.run.call_args
+        runner_mock.run.assert_called_once()
+        call_args = runner_mock.run.call_args
         assert call_args.kwargs["user_id"] == "default_user"
         assert call_args.kwargs["session_id"] == "default_session"
         assert call_args.kwargs["new_message"] is not None
 
-    @patch("strategic_consultant_agent.session_manager.InMemoryRunner")
-    @patch("strategic_consultant_agent.session_manager.create_strategic_analyzer")
-    def test_get_session_id(self, mock_create_agent, mock_runner):
+    def test_sessions_share_analyzer(self, sm_mocks):
+        """Test that the analyzer is built once and reused across sessions."""
+        first = StrategicConsultantSession(session_id="first")
+        second = StrategicConsultantSession(session_id="second")
+
+        sm_mocks.agent_fn.assert_called_once()
+        assert first.agent is second.agent
+
+    def test_get_session_id(self):
         """Test getting session ID."""
         session = StrategicConsultantSession(session_id="test_session_456")
         assert session.get_session_id() == "test_session_456"
 
-    @patch("strategic_consultant_agent.session_manager.InMemoryRunner")
-    @patch("strategic_consultant_agent.session_manager.create_strategic_analyzer")
-    def test_get_user_id(self, mock_create_agent, mock_runner):
+    def test_get_user_id(self):
         """Test getting user ID."""
         session = StrategicConsultantSession(user_id="test_user_789")
         assert session.get_user_id() == "test_user_789"
@@ -73,41 +91,31 @@ class TestStrategicConsultantSession:
 class TestConvenienceFunctions:
     """Test convenience functions for session management."""
 
-    @patch("strategic_consultant_agent.session_manager.InMemoryRunner")
-    @patch("strategic_consultant_agent.session_manager.create_strategic_analyzer")
-    def test_create_runner(self, mock_create_agent, mock_runner):
+    def test_create_runner(self, sm_mocks):
         """Test creating runner."""
         runner = create_runner()
 
         assert runner is not None
-        mock_create_agent.assert_called_once()
-        mock_runner.assert_called_once()
+        sm_mocks.agent_fn.assert_called_once()
+        sm_mocks.runner_cls.assert_called_once()
         # Verify app_name is set
-        call_args = mock_runner.call_args
+        call_args = sm_mocks.runner_cls.call_args
         assert call_args.kwargs["app_name"] == "strategic_consultant"
 
-    @patch("strategic_consultant_agent.session_manager.InMemoryRunner")
-    @patch("strategic_consultant_agent.session_manager.create_strategic_analyzer")
-    def test_run_analysis_default_params(self, mock_create_agent, mock_runner):
+    def test_run_analysis_default_params(self, sm_mocks, runner_mock):
         """Test run_analysis with default parameters."""
-        mock_runner_instance = MagicMock()
-        mock_runner_instance.run = MagicMock(return_value=iter([]))
-        mock_runner.return_value = mock_runner_instance
+        sm_mocks.runner_cls.return_value = runner_mock
 
         list(run_analysis("Should we scale fall detection?"))
 
-        mock_runner_instance.run.assert_called_once()
-        call_args = mock_runner_instance.run.call_args
+        runner_mock.run.assert_called_once()
+        call_args = runner_mock.run.call_args
         assert call_args.kwargs["user_id"] == "default_user"
         assert call_args.kwargs["session_id"] == "default_session"
 
-    @patch("strategic_consultant_agent.session_manager.InMemoryRunner")
-    @patch("strategic_consultant_agent.session_manager.create_strategic_analyzer")
-    def test_run_analysis_custom_params(self, mock_create_agent, mock_runner):
+    def test_run_analysis_custom_params(self, sm_mocks, runner_mock):
         """Test run_analysis with custom parameters."""
-        mock_runner_instance = MagicMock()
-        mock_runner_instance.run = MagicMock(return_value=iter([]))
-        mock_runner.return_value = mock_runner_instance
+        sm_mocks.runner_cls.return_value = runner_mock
 
         list(
             run_analysis(
@@ -117,8 +125,8 @@ class TestConvenienceFunctions:
             )
         )
 
-        mock_runner_instance.run.assert_called_once()
-        call_args = mock_runner_instance.run.call_args
+        runner_mock.run.assert_called_once()
+        call_args = runner_mock.run.call_args
         assert call_args.kwargs["user_id"] == "custom_user"
         assert call_args.kwargs["session_id"] == "custom_session"
 
@@ -126,99 +134,161 @@ class TestConvenienceFunctions:
 class TestMultiTurnConversation:
     """Test multi-turn conversation scenarios."""
 
-    @patch("strategic_consultant_agent.session_manager.InMemoryRunner")
-    @patch("strategic_consultant_agent.session_manager.create_strategic_analyzer")
-    def test_three_turn_conversation(self, mock_create_agent, mock_runner):
-        """Test a three-turn conversation maintaining session."""
-        mock_runner_instance = MagicMock()
-        call_count = 0
+    @pytest.mark.parametrize(
+        "questions",
+        [
+            ["Should we scale fall detection?"],
+            [
+                "Should we scale fall detection?",
+                "What are the top priorities?",
+                "Tell me more about the top priority",
+            ],
+            ["Follow-up question"] * 10,
+        ],
+        ids=["one_turn", "three_turns", "ten_turns"],
+    )
+    def test_session_persists(self, sm_mocks, runner_mock, questions):
+        """Test that every turn runs in the same session."""
+        sm_mocks.runner_cls.return_value = runner_mock
 
-        def mock_run(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            return iter([f"Response {call_count}"])
+        session = StrategicConsultantSession(session_id="multi_turn_session")
+        for question in questions:
+            list(session.run(question))
 
-        mock_runner_instance.run = mock_run
-        mock_runner.return_value = mock_runner_instance
+        assert runner_mock.run.call_count == len(questions)
+        assert all(
+            call.kwargs["session_id"] == "multi_turn_session"
+            for call in runner_mock.run.call_args_list
+        )
 
-        session = StrategicConsultantSession(session_id="multi_turn_session")
 
-        # Turn 1: Initial question
-        list(session.run("Should we scale fall detection?"))
+class TestSessionPool:
+    """Test pooled session creation and reuse."""
 
-        # Turn 2: Follow-up question
-        list(session.run("What are the top priorities?"))
+    def test_prefills_min_sessions(self, sm_mocks):
+        """Test that min_sessions sessions are created up front."""
+        pool = SessionPool(min_sessions=4)
 
-        # Turn 3: Deep dive
-        list(session.run("Tell me more about the top priority"))
+        assert len(pool) == 4
+        assert sm_mocks.runner_cls.call_count == 4
+
+    def test_empty_pool_creates_batch(self, sm_mocks):
+        """Test that acquiring from an empty pool builds inc_step sessions."""
+        pool = SessionPool(min_sessions=0, inc_step=25)
 
-        # Verify all runs used same session_id
-        assert call_count == 3
+        pool.acquire()
 
-    @patch("strategic_consultant_agent.session_manager.InMemoryRunner")
-    @patch("strategic_consultant_agent.session_manager.create_strategic_analyzer")
-    def test_session_id_persists(self, mock_create_agent, mock_runner):
-        """Test that session ID persists across multiple runs."""
-        mock_runner_instance = MagicMock()
-        mock_runner_instance.run = MagicMock(return_value=iter([]))
-        mock_runner.return_value = mock_runner_instance
+        assert sm_mocks.runner_cls.call_count == 25
+        assert len(pool) == 24
 
-        session = StrategicConsultantSession(session_id="persistent_session")
+    def test_release_resets_session(self, sm_mocks):
+        """Test that the next borrower gets a new session ID and runner."""
+        pool = SessionPool(min_sessions=1)
 
-        # Run multiple times
-        list(session.run("Question 1"))
-        list(session.run("Question 2"))
-        list(session.run("Question 3"))
+        session = pool.acquire()
+        pool.release(session)
+        reused = pool.acquire()
 
-        # All calls should use the same session_id
-        assert mock_runner_instance.run.call_count == 3
-        for call in mock_runner_instance.run.call_args_list:
-            assert call.kwargs["session_id"] == "persistent_session"
+        assert reused is not session
+        assert reused.get_session_id() != session.get_session_id()
+        assert sm_mocks.runner_cls.call_count == 2
 
+    def test_release_rejects_foreign_session(self, sm_mocks):
+        """Test that a session from elsewhere cannot be released."""
+        pool = SessionPool(min_sessions=1)
 
-class TestEdgeCases:
-    """Test edge cases and error handling."""
+        with pytest.raises(ValueError, match="not checked out"):
+            pool.release(StrategicConsultantSession())
+        assert len(pool) == 1
 
-    @patch("strategic_consultant_agent.session_manager.InMemoryRunner")
-    @patch("strategic_consultant_agent.session_manager.create_strategic_analyzer")
-    def test_empty_input(self, mock_create_agent, mock_runner):
-        """Test handling of empty input."""
-        mock_runner_instance = MagicMock()
-        mock_runner_instance.run = MagicMock(return_value=iter([]))
-        mock_runner.return_value = mock_runner_instance
+    def test_release_rejects_double_release(self, sm_mocks):
+        """Test that releasing the same session twice raises."""
+        pool = SessionPool(min_sessions=1)
+        session = pool.acquire()
+        pool.release(session)
 
-        session = StrategicConsultantSession()
-        list(session.run(""))
+        with pytest.raises(ValueError, match="not checked out"):
+            pool.release(session)
+        assert len(pool) == 1
 
-        # Should still call runner
-        mock_runner_instance.run.assert_called_once()
+    def test_pooled_sessions_have_unique_ids(self):
+        """Test that each pooled session gets its own session ID."""
+        pool = SessionPool(min_sessions=3)
+        ids = {pool.acquire().get_session_id() for _ in range(3)}
 
-    @patch("strategic_consultant_agent.session_manager.InMemoryRunner")
-    @patch("strategic_consultant_agent.session_manager.create_strategic_analyzer")
-    def test_long_input(self, mock_create_agent, mock_runner):
-        """Test handling of very long input."""
-        mock_runner_instance = MagicMock()
-        mock_runner_instance.run = MagicMock(return_value=iter([]))
-        mock_runner.return_value = mock_runner_instance
+        assert len(ids) == 3
 
-        session = StrategicConsultantSession()
-        long_input = "Should we scale? " * 1000  # Very long question
-        list(session.run(long_input))
+    def test_acquired_session_runs(self, sm_mocks, runner_mock):
+        """Test a multi-turn conversation on a pooled session."""
+        sm_mocks.runner_cls.return_value = runner_mock
+        pool = SessionPool(min_sessions=1)
+
+        session = pool.acquire()
+        for question in ["Should we scale fall detection?", "Show top priorities"]:
+            list(session.run(question))
+        pool.release(session)
+
+        assert runner_mock.run.call_count == 2
+
+    def test_concurrent_acquire_and_release(self, sm_mocks, monkeypatch):
+        """Test that threads sharing a pool never collide on sessions or IDs."""
+
+        class SlowDeque(deque):
+            """Deque whose emptiness check lets other threads run."""
+
+            def __len__(self):
+                size = super().__len__()
+                time.sleep(0.001)
+                return size
 
-        # Should still work
-        mock_runner_instance.run.assert_called_once()
+        monkeypatch.setattr(session_manager, "deque", SlowDeque)
+        pool = SessionPool(min_sessions=1, inc_step=1)
+        start = threading.Barrier(8)
+        acquired = []
+        errors = []
+
+        def borrow():
+            start.wait()
+            try:
+                for _ in range(20):
+                    session = pool.acquire()
+                    acquired.append(session.get_session_id())
+                    time.sleep(0.001)
+                    pool.release(session)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=borrow) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(acquired) == len(set(acquired)) == 160
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"min_sessions": -1}, {"inc_step": 0}], ids=["min", "step"]
+    )
+    def test_rejects_invalid_sizes(self, kwargs):
+        """Test that invalid pool sizes raise ValueError."""
+        with pytest.raises(ValueError):
+            SessionPool(**kwargs)
+
+
+class TestEdgeCases:
+    """Test edge cases and error handling."""
 
-    @patch("strategic_consultant_agent.session_manager.InMemoryRunner")
-    @patch("strategic_consultant_agent.session_manager.create_strategic_analyzer")
-    def test_special_characters_in_input(self, mock_create_agent, mock_runner):
-        """Test handling of special characters."""
-        mock_runner_instance = MagicMock()
-        mock_runner_instance.run = MagicMock(return_value=iter([]))
-        mock_runner.return_value = mock_runner_instance
+    @pytest.mark.parametrize(
+        "payload",
+        ["", _LONG_INPUT, "Should we scale? 💡 #strategy @consultant"],
+        ids=["empty", "long", "special_characters"],
+    )
+    def test_input_edge_cases(self, sm_mocks, runner_mock, payload):
+        """Test that unusual inputs are still passed to the runner."""
+        sm_mocks.runner_cls.return_value = runner_mock
 
         session = StrategicConsultantSession()
-        special_input = "Should we scale? 💡 #strategy @consultant"
-        list(session.run(special_input))
+        list(session.run(payload))
 
-        # Should handle special characters
-        mock_runner_instance.run.assert_called_once()
+        runner_mock.run.assert_called_once()
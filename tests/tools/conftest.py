@@ -0,0 +1,22 @@
+"""Shared fixtures for tool tests."""
+
+import pytest
+
+from strategic_consultant_agent.tools.hypothesis_tree import generate_hypothesis_tree
+
+
+@pytest.fixture(scope="session")
+def scale_tree():
+    """Template-based scale_decision tree shared by read-only tests."""
+    return generate_hypothesis_tree(
+        problem="Should we scale deployment of fall detection?",
+        framework="scale_decision",
+    )
+
+
+@pytest.fixture(scope="session")
+def product_launch_tree():
+    """Template-based product_launch tree shared by read-only tests."""
+    return generate_hypothesis_tree(
+        problem="Should we launch product?", framework="product_launch"
+    )
@@ -7,20 +7,26 @@ from pathlib import Path
 
 from strategic_consultant_agent.tools.framework_loader import (
     FrameworkLoader,
+    get_framework_loader,
     load_framework,
     find_framework_by_trigger,
     list_available_frameworks,
 )
 
 
+@pytest.fixture(scope="module")
+def bundled_loader():
+    """Process-wide loader, shared with the convenience functions."""
+    return get_framework_loader()
+
+
 class TestFrameworkLoader:
     """Test FrameworkLoader class."""
 
-    def test_loads_bundled_templates(self):
+    def test_loads_bundled_templates(self, bundled_loader):
         """Test that loader can load bundled templates."""
-        loader = FrameworkLoader()
-        assert loader.frameworks is not None
-        assert "frameworks" in loader.frameworks
+        assert bundled_loader.frameworks is not None
+        assert "frameworks" in bundled_loader.frameworks
 
     def test_loads_custom_template_path(self, tmp_path):
         """Test loading from custom path."""
@@ -64,47 +70,44 @@ class TestFrameworkLoader:
         with pytest.raises(ValueError, match="missing 'frameworks'"):
             FrameworkLoader(str(invalid_data))
 
-    def test_get_framework_by_name(self):
+    def test_get_framework_by_name(self, bundled_loader):
         """Test retrieving framework by name."""
-        loader = FrameworkLoader()
-        framework = loader.get_framework("scale_decision")
+        framework = bundled_loader.get_framework("scale_decision")
 
         assert framework is not None
         assert "name" in framework
         assert framework["name"] == "Scale Decision Framework"
 
-    def test_get_framework_returns_none_for_invalid_name(self):
+    def test_get_framework_returns_none_for_invalid_name(self, bundled_loader):
         """Test that invalid name returns None."""
-        loader = FrameworkLoader()
-        assert loader.get_framework("nonexistent") is None
+        assert bundled_loader.get_framework("nonexistent") is None
 
-    def test_get_framework_by_trigger_phrase(self):
+    def test_get_framework_by_trigger_phrase(self, bundled_loader):
         """Test finding framework by trigger phrase."""
-        loader = FrameworkLoader()
-
         # Should match "scale_decision" framework
-        framework = loader.get_framework_by_trigger("Should we scale deployment")
+        framework = bundled_loader.get_framework_by_trigger(
+            "Should we scale deployment"
+        )
         assert framework is not None
         assert framework["name"] == "Scale Decision Framework"
 
         # Should match "product_launch" framework
-        framework = loader.get_framework_by_trigger("Should we launch a new product")
+        framework = bundled_loader.get_framework_by_trigger(
+            "Should we launch a new product"
+        )
         assert framework is not None
         assert framework["name"] == "Product Launch Framework"
 
-    def test_trigger_phrase_case_insensitive(self):
+    def test_trigger_phrase_case_insensitive(self, bundled_loader):
         """Test that trigger matching is case-insensitive."""
-        loader = FrameworkLoader()
-
-        framework1 = loader.get_framework_by_trigger("SHOULD WE SCALE")
-        framework2 = loader.get_framework_by_trigger("should we scale")
+        framework1 = bundled_loader.get_framework_by_trigger("SHOULD WE SCALE")
+        framework2 = bundled_loader.get_framework_by_trigger("should we scale")
 
         assert framework1 == framework2
 
-    def test_list_frameworks(self):
+    def test_list_frameworks(self, bundled_loader):
         """Test listing all framework names."""
-        loader = FrameworkLoader()
-        names = loader.list_frameworks()
+        names = bundled_loader.list_frameworks()
 
         assert "scale_decision" in names
         assert "product_launch" in names
@@ -113,10 +116,9 @@ class TestFrameworkLoader:
         assert "operations_improvement" in names
         assert "custom" in names
 
-    def test_get_framework_names_with_descriptions(self):
+    def test_get_framework_names_with_descriptions(self, bundled_loader):
         """Test getting framework names with descriptions."""
-        loader = FrameworkLoader()
-        descriptions = loader.get_framework_names_with_descriptions()
+        descriptions = bundled_loader.get_framework_names_with_descriptions()
 
         assert "scale_decision" in descriptions
         assert isinstance(descriptions["scale_decision"], str)
@@ -126,6 +128,10 @@ class TestFrameworkLoader:
 class TestConvenienceFunctions:
     """Test module-level convenience functions."""
 
+    def test_get_framework_loader_returns_singleton(self):
+        """Test that the global loader is built once and reused."""
+        assert get_framework_loader() is get_framework_loader()
+
     def test_load_framework(self):
         """Test load_framework convenience function."""
         framework = load_framework("scale_decision")
@@ -1,70 +1,67 @@
 """Tests for hypothesis_tree module."""
 
+import json
+
 import pytest
 
 from strategic_consultant_agent.tools.hypothesis_tree import (
     generate_hypothesis_tree,
     _build_custom_framework,
+    _build_hypothesis_tree,
     _generate_l3_leaf,
     _infer_metric_type,
     _generate_target,
     _suggest_data_source,
 )
 
+# (framework, expected framework_name, expected L1 categories); None skips the check
+FRAMEWORK_CASES = [
+    (
+        "scale_decision",
+        "Scale Decision Framework",
+        {"DESIRABILITY", "FEASIBILITY", "VIABILITY"},
+    ),
+    (
+        "product_launch",
+        "Product Launch Framework",
+        {"DESIRABILITY", "FEASIBILITY", "VIABILITY"},
+    ),
+    (
+        "market_entry",
+        None,
+        {"MARKET_ATTRACTIVENESS", "COMPETITIVE_POSITION", "EXECUTION_CAPABILITY"},
+    ),
+    ("investment_decision", None, None),
+    ("operations_improvement", None, None),
+]
+
 
 class TestGenerateHypothesisTree:
     """Test generate_hypothesis_tree function."""
 
-    def test_generates_scale_decision_tree(self):
-        """Test generating tree for scale_decision framework."""
-        tree = generate_hypothesis_tree(
-            problem="Should we scale fall detection deployment?",
-            framework="scale_decision",
-        )
-
-        assert tree["problem"] == "Should we scale fall detection deployment?"
-        assert tree["framework"] == "scale_decision"
-        assert tree["framework_name"] == "Scale Decision Framework"
-        assert "tree" in tree
+    @pytest.mark.parametrize(
+        "framework,framework_name,l1_categories",
+        FRAMEWORK_CASES,
+        ids=[case[0] for case in FRAMEWORK_CASES],
+    )
+    def test_framework_generation(self, framework, framework_name, l1_categories):
+        """Test generating a tree for each standard framework."""
+        tree = generate_hypothesis_tree(problem="Test problem", framework=framework)
+
+        assert tree["problem"] == "Test problem"
+        assert tree["framework"] == framework
         assert "metadata" in tree
+        assert len(tree["tree"]) > 0
 
-        # Check L1 categories
-        assert "DESIRABILITY" in tree["tree"]
-        assert "FEASIBILITY" in tree["tree"]
-        assert "VIABILITY" in tree["tree"]
-
-    def test_generates_product_launch_tree(self):
-        """Test generating tree for product_launch framework."""
-        tree = generate_hypothesis_tree(
-            problem="Should we launch telehealth product?",
-            framework="product_launch",
-        )
-
-        assert tree["framework"] == "product_launch"
-        assert tree["framework_name"] == "Product Launch Framework"
-        assert "DESIRABILITY" in tree["tree"]
-        assert "FEASIBILITY" in tree["tree"]
-        assert "VIABILITY" in tree["tree"]
+        if framework_name is not None:
+            assert tree["framework_name"] == framework_name
+        if l1_categories is not None:
+            assert l1_categories.issubset(tree["tree"])
 
-    def test_generates_market_entry_tree(self):
-        """Test generating tree for market_entry framework."""
-        tree = generate_hypothesis_tree(
-            problem="Should we enter European market?", framework="market_entry"
-        )
-
-        assert tree["framework"] == "market_entry"
-        assert "MARKET_ATTRACTIVENESS" in tree["tree"]
-        assert "COMPETITIVE_POSITION" in tree["tree"]
-        assert "EXECUTION_CAPABILITY" in tree["tree"]
-
-    def test_tree_has_complete_structure(self):
+    def test_tree_has_complete_structure(self, scale_tree):
         """Test that tree has complete L1/L2/L3 structure."""
-        tree = generate_hypothesis_tree(
-            problem="Test problem", framework="scale_decision"
-        )
-
         # Check L1 has L2 branches
-        l1_desirability = tree["tree"]["DESIRABILITY"]
+        l1_desirability = scale_tree["tree"]["DESIRABILITY"]
         assert "L2_branches" in l1_desirability
         assert len(l1_desirability["L2_branches"]) > 0
 
@@ -100,6 +97,16 @@ class TestGenerateHypothesisTree:
         assert "RISK" in tree["tree"]
         assert "OPERATIONS" in tree["tree"]
 
+    def test_repeated_calls_return_independent_trees(self):
+        """Test that cached template trees are not shared between callers."""
+        first = generate_hypothesis_tree(problem="Cache check")
+        first["tree"].clear()
+
+        second = generate_hypothesis_tree(problem="Cache check")
+
+        assert second["tree"]
+        assert second is not first
+
     def test_custom_framework_requires_categories(self):
         """Test that custom framework requires custom_l1_categories."""
         with pytest.raises(ValueError, match="custom_l1_categories required"):
@@ -110,21 +117,6 @@ class TestGenerateHypothesisTree:
         with pytest.raises(ValueError, match="Unknown framework"):
             generate_hypothesis_tree(problem="Test", framework="nonexistent")
 
-    def test_all_standard_frameworks(self):
-        """Test all standard frameworks can be generated."""
-        frameworks = [
-            "scale_decision",
-            "product_launch",
-            "market_entry",
-            "investment_decision",
-            "operations_improvement",
-        ]
-
-        for framework in frameworks:
-            tree = generate_hypothesis_tree(problem="Test problem", framework=framework)
-            assert tree["framework"] == framework
-            assert len(tree["tree"]) > 0
-
 
 class TestBuildCustomFramework:
     """Test _build_custom_framework function."""
@@ -171,90 +163,79 @@ class TestGenerateL3Leaf:
 class TestInferMetricType:
     """Test _infer_metric_type function."""
 
-    def test_infers_binary(self):
-        """Test inferring binary metric type."""
-        assert _infer_metric_type("System Integration Possible") == "binary"
-        assert _infer_metric_type("Compliance Ready") == "binary"
-        assert _infer_metric_type("Capability Exists") == "binary"
-
-    def test_infers_quantitative(self):
-        """Test inferring quantitative metric type."""
-        assert _infer_metric_type("Cost Reduction") == "quantitative"
-        assert _infer_metric_type("Growth Rate") == "quantitative"
-        assert _infer_metric_type("Response Time Improvement") == "quantitative"
-        assert _infer_metric_type("Revenue Impact") == "quantitative"
-
-    def test_infers_qualitative_as_default(self):
-        """Test inferring qualitative as default."""
-        assert _infer_metric_type("Stakeholder Satisfaction") == "qualitative"
-        assert _infer_metric_type("Brand Alignment") == "qualitative"
-        assert _infer_metric_type("User Experience") == "qualitative"
+    @pytest.mark.parametrize(
+        "label,expected",
+        [
+            ("System Integration Possible", "binary"),
+            ("Compliance Ready", "binary"),
+            ("Capability Exists", "binary"),
+            ("Cost Reduction", "quantitative"),
+            ("Growth Rate", "quantitative"),
+            ("Response Time Improvement", "quantitative"),
+            ("Revenue Impact", "quantitative"),
+            # Qualitative is the default
+            ("Stakeholder Satisfaction", "qualitative"),
+            ("Brand Alignment", "qualitative"),
+            ("User Experience", "qualitative"),
+        ],
+    )
+    def test_infer_metric_type(self, label, expected):
+        """Test inferring metric type from label keywords."""
+        assert _infer_metric_type(label) == expected
 
 
 class TestGenerateTarget:
     """Test _generate_target function."""
 
-    def test_generates_binary_target(self):
-        """Test generating target for binary metrics."""
-        target = _generate_target("Compliance Ready", "binary")
-        assert "Yes" in target or "Confirmed" in target
-
-    def test_generates_quantitative_target(self):
-        """Test generating target for quantitative metrics."""
-        target = _generate_target("Cost Reduction", "quantitative")
-        assert "%" in target or "ROI" in target or "days" in target
-
-    def test_generates_qualitative_target(self):
-        """Test generating target for qualitative metrics."""
-        target = _generate_target("User Satisfaction", "qualitative")
-        assert "positive" in target.lower()
+    @pytest.mark.parametrize(
+        "label,metric_type,check",
+        [
+            ("Compliance Ready", "binary", lambda t: "Yes" in t or "Confirmed" in t),
+            (
+                "Cost Reduction",
+                "quantitative",
+                lambda t: "%" in t or "ROI" in t or "days" in t,
+            ),
+            ("User Satisfaction", "qualitative", lambda t: "positive" in t.lower()),
+        ],
+        ids=["binary", "quantitative", "qualitative"],
+    )
+    def test_generate_target(self, label, metric_type, check):
+        """Test generating a target for each metric type."""
+        assert check(_generate_target(label, metric_type))
 
 
 class TestSuggestDataSource:
     """Test _suggest_data_source function."""
 
-    def test_suggests_financial_source(self):
-        """Test suggesting financial data source."""
-        source = _suggest_data_source("Cost Savings", "Financial Impact")
-        assert "financial" in source.lower() or "budget" in source.lower()
-
-    def test_suggests_technical_source(self):
-        """Test suggesting technical data source."""
-        source = _suggest_data_source("System Integration", "Technical")
-        assert "technical" in source.lower() or "specification" in source.lower()
-
-    def test_suggests_user_source(self):
-        """Test suggesting user data source."""
-        source = _suggest_data_source("User Satisfaction", "Experience")
-        assert (
-            "survey" in source.lower()
-            or "feedback" in source.lower()
-            or "interview" in source.lower()
-        )
-
-    def test_suggests_market_source(self):
-        """Test suggesting market data source."""
-        source = _suggest_data_source("Market Growth", "Market Analysis")
-        assert "market" in source.lower() or "industry" in source.lower()
+    @pytest.mark.parametrize(
+        "label,l2_context,keywords",
+        [
+            ("Cost Savings", "Financial Impact", ("financial", "budget")),
+            ("System Integration", "Technical", ("technical", "specification")),
+            ("User Satisfaction", "Experience", ("survey", "feedback", "interview")),
+            ("Market Growth", "Market Analysis", ("market", "industry")),
+        ],
+        ids=["financial", "technical", "user", "market"],
+    )
+    def test_suggest_data_source(self, label, l2_context, keywords):
+        """Test suggesting a data source matching the label's domain."""
+        source = _suggest_data_source(label, l2_context).lower()
+        assert any(keyword in source for keyword in keywords)
 
 
 class TestIntegration:
     """Integration tests for full workflow."""
 
-    def test_full_workflow_generates_valid_tree(self):
+    def test_full_workflow_generates_valid_tree(self, scale_tree):
         """Test complete workflow generates valid tree."""
-        tree = generate_hypothesis_tree(
-            problem="Should we scale deployment of fall detection?",
-            framework="scale_decision",
-        )
-
         # Validate structure
-        assert isinstance(tree, dict)
-        assert "tree" in tree
-        assert "metadata" in tree
+        assert isinstance(scale_tree, dict)
+        assert "tree" in scale_tree
+        assert "metadata" in scale_tree
 
         # Validate all L3 leaves have required fields
-        for l1_key, l1_value in tree["tree"].items():
+        for l1_key, l1_value in scale_tree["tree"].items():
             for l2_key, l2_value in l1_value["L2_branches"].items():
                 for l3_leaf in l2_value["L3_leaves"]:
                     assert "id" in l3_leaf
@@ -269,12 +250,15 @@ class TestIntegration:
                     assert "target" in l3_leaf
                     assert "data_source" in l3_leaf
 
-    def test_tree_json_serializable(self):
-        """Test that generated tree is JSON serializable."""
-        import json
-
-        tree = generate_hypothesis_tree(problem="Test", framework="scale_decision")
+    def test_tree_json_serializable(self, scale_tree):
+        """Test that the cached tree matches one built without the cache."""
+        built = _build_hypothesis_tree(
+            problem="Should we scale deployment of fall detection?",
+            framework="scale_decision",
+            use_llm_generation=False,
+        )
 
-        # Should not raise exception
-        json_str = json.dumps(tree)
-        assert len(json_str) > 0
+        assert json.loads(json.dumps(built)) == built
+        assert scale_tree == built
+        # Serializing must keep category order for the UI
+        assert list(scale_tree["tree"]) == list(built["tree"])
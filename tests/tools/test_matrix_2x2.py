@@ -10,79 +10,85 @@ from strategic_consultant_agent.tools.matrix_2x2 import (
     _generate_recommendations,
 )
 
+# (matrix_type, x_axis, y_axis, expected quadrant names)
+MATRIX_CASES = [
+    (
+        "prioritization",
+        "Effort",
+        "Impact",
+        {
+            "Q1": "Quick Wins",
+            "Q2": "Strategic Bets",
+            "Q3": "Fill Later",
+            "Q4": "Hard Slogs",
+        },
+    ),
+    (
+        "bcg",
+        "Market Share",
+        "Growth",
+        {"Q1": "Stars", "Q2": "Question Marks", "Q3": "Dogs", "Q4": "Cash Cows"},
+    ),
+    (
+        "risk",
+        "Likelihood",
+        "Impact",
+        {"Q1": "Mitigate", "Q2": "Monitor", "Q3": "Accept", "Q4": "Reduce"},
+    ),
+    (
+        "eisenhower",
+        "Urgency",
+        "Importance",
+        {"Q1": "Do First", "Q2": "Schedule", "Q3": "Delegate", "Q4": "Eliminate"},
+    ),
+    (
+        "custom",
+        "Complexity",
+        "Value",
+        {
+            "Q1": "High Value, Low Complexity",
+            "Q2": "High Value, High Complexity",
+            "Q3": "Low Value, Low Complexity",
+            "Q4": "Low Value, High Complexity",
+        },
+    ),
+]
+MATRIX_IDS = [case[0] for case in MATRIX_CASES]
+
+TEN_ITEMS = tuple(f"Item {i}" for i in range(10))
+
 
 class TestGenerate2x2Matrix:
     """Test generate_2x2_matrix function."""
 
-    def test_generates_prioritization_matrix(self):
-        """Test generating a prioritization matrix."""
+    @pytest.mark.parametrize(
+        "matrix_type,x_axis,y_axis,expected", MATRIX_CASES, ids=MATRIX_IDS
+    )
+    def test_generates_matrix(self, matrix_type, x_axis, y_axis, expected):
+        """Test generating a matrix of each type."""
         items = [
             "Validate fall detection accuracy",
             "Assess staff workflow impact",
             "Calculate full ROI model",
         ]
 
-        result = generate_2x2_matrix(items, matrix_type="prioritization")
-
-        assert result["matrix_type"] == "prioritization"
-        assert result["x_axis"] == "Effort"
-        assert result["y_axis"] == "Impact"
-        assert "quadrants" in result
-        assert "Q1" in result["quadrants"]
-        assert result["quadrants"]["Q1"]["name"] == "Quick Wins"
-        assert "items" in result
-        assert len(result["items"]) == 3
-        assert "assessments" in result
-        assert "placements" in result
-        assert "recommendations" in result
-
-    def test_generates_bcg_matrix(self):
-        """Test generating a BCG matrix."""
-        items = ["Product A", "Product B"]
-
-        result = generate_2x2_matrix(
-            items, x_axis="Market Share", y_axis="Growth", matrix_type="bcg"
-        )
-
-        assert result["matrix_type"] == "bcg"
-        assert result["quadrants"]["Q1"]["name"] == "Stars"
-        assert result["quadrants"]["Q4"]["name"] == "Cash Cows"
-
-    def test_generates_risk_matrix(self):
-        """Test generating a risk matrix."""
-        items = ["Privacy breach", "System downtime"]
-
-        result = generate_2x2_matrix(
-            items, x_axis="Likelihood", y_axis="Impact", matrix_type="risk"
-        )
-
-        assert result["matrix_type"] == "risk"
-        assert result["quadrants"]["Q1"]["name"] == "Mitigate"
-        assert result["quadrants"]["Q3"]["name"] == "Accept"
-
-    def test_generates_eisenhower_matrix(self):
-        """Test generating an Eisenhower matrix."""
-        items = ["Critical bug fix", "Documentation update"]
-
         result = generate_2x2_matrix(
-            items, x_axis="Urgency", y_axis="Importance", matrix_type="eisenhower"
+            items, x_axis=x_axis, y_axis=y_axis, matrix_type=matrix_type
         )
 
-        assert result["matrix_type"] == "eisenhower"
-        assert result["quadrants"]["Q1"]["name"] == "Do First"
-        assert result["quadrants"]["Q4"]["name"] == "Eliminate"
-
-    def test_generates_custom_matrix(self):
-        """Test generating a custom matrix."""
-        items = ["Item 1", "Item 2"]
+        assert result["matrix_type"] == matrix_type
+        assert result["x_axis"] == x_axis
+        assert result["y_axis"] == y_axis
+        assert {q: d["name"] for q, d in result["quadrants"].items()} == expected
+        assert len(result["items"]) == 3
 
-        result = generate_2x2_matrix(
-            items, x_axis="Complexity", y_axis="Value", matrix_type="custom"
-        )
+    def test_defaults_to_effort_impact_prioritization(self):
+        """Test the default matrix type and axes."""
+        result = generate_2x2_matrix(["Test item"])
 
-        assert result["matrix_type"] == "custom"
-        assert "Complexity" in result["quadrants"]["Q1"]["name"]
-        assert "Value" in result["quadrants"]["Q1"]["name"]
+        assert result["matrix_type"] == "prioritization"
+        assert result["x_axis"] == "Effort"
+        assert result["y_axis"] == "Impact"
 
     def test_uses_provided_assessments(self):
         """Test using provided assessments instead of auto-assessment."""
@@ -123,51 +129,26 @@ class TestGenerate2x2Matrix:
 class TestGetQuadrantDefinitions:
     """Test _get_quadrant_definitions function."""
 
-    def test_returns_prioritization_quadrants(self):
-        """Test prioritization quadrant definitions."""
-        quadrants = _get_quadrant_definitions("prioritization", "Effort", "Impact")
-
-        assert len(quadrants) == 4
-        assert quadrants["Q1"]["name"] == "Quick Wins"
-        assert quadrants["Q2"]["name"] == "Strategic Bets"
-        assert quadrants["Q3"]["name"] == "Fill Later"
-        assert quadrants["Q4"]["name"] == "Hard Slogs"
-        assert "action" in quadrants["Q1"]
-
-    def test_returns_bcg_quadrants(self):
-        """Test BCG quadrant definitions."""
-        quadrants = _get_quadrant_definitions("bcg", "Market Share", "Growth")
+    @pytest.mark.parametrize(
+        "matrix_type,x_axis,y_axis,expected", MATRIX_CASES, ids=MATRIX_IDS
+    )
+    def test_returns_quadrants(self, matrix_type, x_axis, y_axis, expected):
+        """Test quadrant definitions for each matrix type."""
+        quadrants = _get_quadrant_definitions(matrix_type, x_axis, y_axis)
 
-        assert quadrants["Q1"]["name"] == "Stars"
-        assert quadrants["Q2"]["name"] == "Question Marks"
-        assert quadrants["Q3"]["name"] == "Dogs"
-        assert quadrants["Q4"]["name"] == "Cash Cows"
+        assert {q: d["name"] for q, d in quadrants.items()} == expected
+        assert all("position" in q and "action" in q for q in quadrants.values())
 
-    def test_returns_risk_quadrants(self):
-        """Test risk quadrant definitions."""
-        quadrants = _get_quadrant_definitions("risk", "Likelihood", "Impact")
+    def test_matrices_do_not_share_definitions(self):
+        """Test that editing one matrix's quadrants leaves the next intact."""
+        first = generate_2x2_matrix(["Item 1"])
+        first["quadrants"]["Q1"]["name"] = "Renamed"
+        first["quadrants"]["Q2"] = {}
 
-        assert quadrants["Q1"]["name"] == "Mitigate"
-        assert quadrants["Q2"]["name"] == "Monitor"
-        assert quadrants["Q3"]["name"] == "Accept"
-        assert quadrants["Q4"]["name"] == "Reduce"
+        second = generate_2x2_matrix(["Item 1"])
 
-    def test_returns_eisenhower_quadrants(self):
-        """Test Eisenhower quadrant definitions."""
-        quadrants = _get_quadrant_definitions("eisenhower", "Urgency", "Importance")
-
-        assert quadrants["Q1"]["name"] == "Do First"
-        assert quadrants["Q2"]["name"] == "Schedule"
-        assert quadrants["Q3"]["name"] == "Delegate"
-        assert quadrants["Q4"]["name"] == "Eliminate"
-
-    def test_returns_custom_quadrants(self):
-        """Test custom quadrant definitions."""
-        quadrants = _get_quadrant_definitions("custom", "Cost", "Benefit")
-
-        assert "Benefit" in quadrants["Q1"]["name"]
-        assert "Cost" in quadrants["Q1"]["name"]
-        assert all("position" in q for q in quadrants.values())
+        assert second["quadrants"]["Q1"]["name"] == "Quick Wins"
+        assert second["quadrants"]["Q2"]["name"] == "Strategic Bets"
 
 
 class TestAutoAssessItems:
@@ -196,13 +177,11 @@ class TestAutoAssessItems:
 
     def test_distributes_items_across_quadrants(self):
         """Test that items are distributed across quadrants."""
-        items = [f"Item {i}" for i in range(10)]
-
-        assessments = _auto_assess_items(items, "Effort", "Impact")
+        assessments = _auto_assess_items(TEN_ITEMS, "Effort", "Impact")
 
         # Should have mix of high/low values
-        x_values = [assessments[item]["x"] for item in items]
-        y_values = [assessments[item]["y"] for item in items]
+        x_values = [assessments[item]["x"] for item in TEN_ITEMS]
+        y_values = [assessments[item]["y"] for item in TEN_ITEMS]
 
         assert "high" in x_values
         assert "low" in x_values
@@ -256,9 +235,10 @@ class TestPlaceItemsInQuadrants:
         # Item 2 should default to Q3
         assert "Item 2" in placements["Q3"]
 
-    def test_all_items_placed_exactly_once(self):
+    @pytest.mark.parametrize("count", [5, 10])
+    def test_all_items_placed_exactly_once(self, count):
         """Test that all items are placed exactly once."""
-        items = [f"Item {i}" for i in range(5)]
+        items = [f"Item {i}" for i in range(count)]
         assessments = {item: {"x": "low", "y": "high"} for item in items}
         quadrants = _get_quadrant_definitions("prioritization", "Effort", "Impact")
 
@@ -393,7 +373,7 @@ class TestIntegration:
         result = generate_2x2_matrix(items)
 
         # Should not raise exception
-        json_str = json.dumps(result, indent=2)
+        json_str = json.dumps(result)
         assert len(json_str) > 0
 
         # Should be deserializable
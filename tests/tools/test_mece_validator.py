@@ -9,6 +9,9 @@ from strategic_consultant_agent.tools.mece_validator import (
     _check_level_consistency,
 )
 
+# More L1 categories than a MECE tree should have
+SEVEN_CATS = {f"CAT{i}": {"label": f"Category {i}"} for i in range(1, 8)}
+
 
 class TestValidateMeceStructure:
     """Test validate_mece_structure function."""
@@ -191,9 +194,7 @@ class TestCheckLevelConsistency:
 
     def test_detects_too_many_categories(self):
         """Test detecting too many L1 categories."""
-        tree = {f"CAT{i}": {"label": f"Category {i}"} for i in range(1, 8)}
-
-        inconsistencies = _check_level_consistency(tree)
+        inconsistencies = _check_level_consistency(SEVEN_CATS)
 
         assert any("categories" in issue.lower() for issue in inconsistencies)
 
@@ -214,36 +215,19 @@ class TestCheckLevelConsistency:
 class TestIntegration:
     """Integration tests."""
 
-    def test_validates_real_hypothesis_tree(self):
+    def test_validates_real_hypothesis_tree(self, scale_tree):
         """Test validating a real hypothesis tree structure."""
-        from strategic_consultant_agent.tools.hypothesis_tree import (
-            generate_hypothesis_tree,
-        )
-
-        tree = generate_hypothesis_tree(
-            problem="Should we scale deployment?", framework="scale_decision"
-        )
-
-        result = validate_mece_structure(tree)
+        result = validate_mece_structure(scale_tree)
 
         # Should pass MECE validation
         assert "is_mece" in result
         assert "issues" in result
         assert "suggestions" in result
 
-    def test_full_workflow(self):
+    def test_full_workflow(self, product_launch_tree):
         """Test full workflow from generation to validation."""
-        from strategic_consultant_agent.tools.hypothesis_tree import (
-            generate_hypothesis_tree,
-        )
-
-        # Generate tree
-        tree = generate_hypothesis_tree(
-            problem="Should we launch product?", framework="product_launch"
-        )
-
-        # Validate it
-        result = validate_mece_structure(tree)
+        # Validate the generated tree
+        result = validate_mece_structure(product_launch_tree)
 
         # Should have structure
         assert isinstance(result, dict)
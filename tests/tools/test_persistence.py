@@ -1,86 +1,99 @@
 """Tests for persistence module."""
 
+import errno
 import json
+import math
 import os
-import tempfile
+import shutil
+import sqlite3
+import threading
+import uuid
+from contextlib import closing, contextmanager
+from datetime import datetime
 from pathlib import Path
 
 import pytest
 
+from strategic_consultant_agent.tools import persistence
 from strategic_consultant_agent.tools.persistence import (
     save_analysis,
+    save_analysis_many,
     load_analysis,
     delete_analysis,
     get_latest_version,
+    build_index,
     _sanitize_filename,
     _list_project_analyses,
+    _paths,
+    _scan_latest_version,
+    _scan_project_analyses,
 )
 
 
 @pytest.fixture
-def temp_storage():
-    """Create a temporary storage directory for tests."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield temp_dir
+def temp_storage(tmp_path):
+    """Per-test storage directory under pytest's session temp root."""
+    return str(tmp_path)
 
 
-class TestSaveAnalysis:
-    """Test save_analysis function."""
+@pytest.fixture(params=["json", "orjson"])
+def json_backend(request, monkeypatch):
+    """Run a test with the stdlib json encoder and, if installed, with orjson."""
+    module = pytest.importorskip("orjson") if request.param == "orjson" else None
+    monkeypatch.setattr(persistence, "orjson", module)
+    return request.param
 
-    def test_saves_hypothesis_tree(self, temp_storage):
-        """Test saving a hypothesis tree."""
-        content = {
-            "problem": "Should we scale?",
-            "tree": {
-                "DESIRABILITY": {"label": "Desirability"},
-            },
-        }
 
-        result = save_analysis(
-            project_name="test_project",
-            analysis_type="hypothesis_tree",
-            content=content,
-            storage_dir=temp_storage,
-        )
+@contextmanager
+def other_process(monkeypatch):
+    """Run persistence calls with fresh module state, like a second process."""
+    connections = {}
+    with monkeypatch.context() as m:
+        m.setattr(persistence, "_index_connections", connections)
+        m.setattr(persistence, "_latest_versions", {})
+        yield
+    for conn in connections.values():
+        conn.close()
 
-        assert "filepath" in result
-        assert "version" in result
-        assert result["version"] == 1
-        assert "timestamp" in result
-        assert Path(result["filepath"]).exists()
 
-    def test_saves_matrix(self, temp_storage):
-        """Test saving a matrix."""
-        content = {
-            "matrix_type": "prioritization",
-            "items": ["Item 1", "Item 2"],
-        }
-
-        result = save_analysis(
-            project_name="test_project",
-            analysis_type="matrix",
-            content=content,
-            storage_dir=temp_storage,
-        )
-
-        assert result["version"] == 1
-        assert Path(result["filepath"]).exists()
-
-    def test_saves_research(self, temp_storage):
-        """Test saving research."""
-        content = {
-            "market_research": "Market is growing at 15% CAGR",
-            "sources": ["Industry report 2024"],
-        }
+class TestSaveAnalysis:
+    """Test save_analysis function."""
 
+    @pytest.mark.parametrize(
+        "analysis_type,content",
+        [
+            (
+                "hypothesis_tree",
+                {
+                    "problem": "Should we scale?",
+                    "tree": {"DESIRABILITY": {"label": "Desirability"}},
+                },
+            ),
+            (
+                "matrix",
+                {"matrix_type": "prioritization", "items": ["Item 1", "Item 2"]},
+            ),
+            (
+                "research",
+                {
+                    "market_research": "Market is growing at 15% CAGR",
+                    "sources": ["Industry report 2024"],
+                },
+            ),
+        ],
+        ids=["hypothesis_tree", "matrix", "research"],
+    )
+    def test_saves_analysis(self, temp_storage, analysis_type, content):
+        """Test saving each kind of analysis."""
         result = save_analysis(
             project_name="test_project",
-            analysis_type="research",
+            analysis_type=analysis_type,
             content=content,
             storage_dir=temp_storage,
         )
 
         assert result["version"] == 1
+        assert "timestamp" in result
         assert Path(result["filepath"]).exists()
 
     def test_increments_version_number(self, temp_storage):
@@ -105,6 +118,98 @@ class TestSaveAnalysis:
         )
         assert result3["version"] == 3
 
+    def test_save_many_assigns_consecutive_versions(self, temp_storage):
+        """Test that a batch save continues from the latest version."""
+        save_analysis("test_project", "hypothesis_tree", {"v": 1}, temp_storage)
+
+        results = save_analysis_many(
+            "test_project", "hypothesis_tree", [{"v": 2}, {"v": 3}], temp_storage
+        )
+
+        assert [result["version"] for result in results] == [2, 3]
+        loaded = load_analysis(
+            "test_project", "hypothesis_tree", version=3, storage_dir=temp_storage
+        )
+        assert loaded["content"] == {"v": 3}
+
+    @pytest.mark.parametrize(
+        "contents,written",
+        [([{"bad": object()}], []), ([{"v": 1}, {"bad": object()}], [1])],
+        ids=["nothing_written", "partly_written"],
+    )
+    def test_failed_save_gives_back_unused_versions(
+        self, temp_storage, contents, written
+    ):
+        """Test that the save after a failed one continues from the files."""
+        with pytest.raises(TypeError):
+            save_analysis_many("test_project", "research", contents, temp_storage)
+
+        result = save_analysis("test_project", "research", {"v": 2}, temp_storage)
+
+        assert result["version"] == len(written) + 1
+        latest = get_latest_version(
+            "test_project", "research", storage_dir=temp_storage
+        )
+        assert latest == result["version"]
+
+    @pytest.mark.parametrize(
+        "durable,expected_fsyncs", [(False, 0), (True, 4)], ids=["default", "durable"]
+    )
+    def test_durable_fsyncs_files_and_directory_once(
+        self, temp_storage, monkeypatch, durable, expected_fsyncs
+    ):
+        """Test that durable batches fsync each file plus the directory once."""
+        fsynced = []
+        real_fsync = os.fsync
+
+        def recording_fsync(fd):
+            fsynced.append(fd)
+            real_fsync(fd)
+
+        monkeypatch.setattr(os, "fsync", recording_fsync)
+
+        save_analysis_many(
+            "test_project",
+            "research",
+            [{"v": 1}, {"v": 2}, {"v": 3}],
+            temp_storage,
+            durable=durable,
+        )
+
+        assert len(fsynced) == expected_fsyncs
+
+    def test_writes_do_not_hold_the_version_lock(self, temp_storage, monkeypatch):
+        """Test that a save reserves its version while another is mid-write."""
+        writing, finish = threading.Event(), threading.Event()
+        timed_out = []
+        real_write = persistence._write_new_file
+
+        def blocking_write(filepath, chunks, durable=False):
+            if filepath.endswith("_v1.json"):
+                writing.set()
+                timed_out.append(not finish.wait(5))
+            real_write(filepath, chunks, durable)
+
+        monkeypatch.setattr(persistence, "_write_new_file", blocking_write)
+        first = threading.Thread(
+            target=save_analysis,
+            args=("test_project", "research", {"v": 1}, temp_storage),
+        )
+        first.start()
+        try:
+            assert writing.wait(5)
+            second = save_analysis("test_project", "research", {"v": 2}, temp_storage)
+        finally:
+            finish.set()
+            first.join()
+
+        assert timed_out == [False]
+        assert second["version"] == 2
+        loaded = load_analysis(
+            "test_project", "research", version=1, storage_dir=temp_storage
+        )
+        assert loaded["content"] == {"v": 1}
+
     def test_creates_project_directory(self, temp_storage):
         """Test that project directory is created."""
         content = {"data": "test"}
@@ -117,6 +222,58 @@ class TestSaveAnalysis:
         assert project_dir.exists()
         assert project_dir.is_dir()
 
+    def test_recreates_removed_project_directory(self, temp_storage):
+        """Test saving after the project directory was removed externally."""
+        save_analysis("test_project", "hypothesis_tree", {"a": 1}, temp_storage)
+        shutil.rmtree(Path(temp_storage) / "test_project")
+
+        result = save_analysis("test_project", "research", {"b": 2}, temp_storage)
+
+        assert Path(result["filepath"]).exists()
+
+    def test_leaves_no_temp_files(self, temp_storage):
+        """Test that the atomic write cleans up its temp file."""
+        save_analysis("test_project", "hypothesis_tree", {"a": 1}, temp_storage)
+
+        project_dir = Path(temp_storage) / "test_project"
+        assert [p.name for p in project_dir.iterdir()] == ["hypothesis_tree_v1.json"]
+
+    def test_saved_files_follow_umask(self, temp_storage):
+        """Test that saved files get the usual mode, not mkstemp's 0600."""
+        umask = os.umask(0)
+        os.umask(umask)
+
+        result = save_analysis("test_project", "research", {"a": 1}, temp_storage)
+
+        assert os.stat(result["filepath"]).st_mode & 0o777 == 0o666 & ~umask
+
+    @pytest.mark.parametrize("link_errno", [errno.EPERM, errno.EXDEV])
+    def test_saves_without_hard_links(self, temp_storage, monkeypatch, link_errno):
+        """Test the copy fallback on filesystems that refuse hard links."""
+
+        def refusing_link(src, dst):
+            raise OSError(link_errno, os.strerror(link_errno))
+
+        monkeypatch.setattr(os, "link", refusing_link)
+        umask = os.umask(0)
+        os.umask(umask)
+
+        save_analysis("test_project", "research", {"v": 1}, temp_storage)
+        # Simulate another process saving version 2 behind the cache
+        project_dir = Path(temp_storage) / "test_project"
+        (project_dir / "research_v2.json").write_text("{}", encoding="utf-8")
+        result = save_analysis("test_project", "research", {"v": 3}, temp_storage)
+
+        assert result["version"] == 3
+        assert os.stat(result["filepath"]).st_mode & 0o777 == 0o666 & ~umask
+        assert sorted(p.name for p in project_dir.iterdir()) == [
+            "research_v1.json",
+            "research_v2.json",
+            "research_v3.json",
+        ]
+        loaded = load_analysis("test_project", "research", storage_dir=temp_storage)
+        assert loaded["content"] == {"v": 3}
+
     def test_sanitizes_project_name(self, temp_storage):
         """Test that project name is sanitized for filesystem."""
         content = {"data": "test"}
@@ -151,6 +308,51 @@ class TestSaveAnalysis:
         assert "timestamp" in data["metadata"]
         assert data["content"] == content
 
+    def test_timestamp_is_iso_format(self, temp_storage):
+        """Test that timestamps stay ISO 8601 strings for API and UI readers."""
+        result = save_analysis("test_project", "research", {"a": 1}, temp_storage)
+
+        loaded = load_analysis("test_project", "research", storage_dir=temp_storage)
+
+        assert loaded["metadata"]["timestamp"] == result["timestamp"]
+        assert datetime.fromisoformat(result["timestamp"])
+
+    @pytest.mark.parametrize("pretty", [False, True], ids=["compact", "pretty"])
+    def test_pretty_controls_indentation(self, temp_storage, pretty):
+        """Test that files are compact unless pretty output is requested."""
+        content = {"data": "test"}
+
+        result = save_analysis(
+            "test_project", "research", content, temp_storage, pretty=pretty
+        )
+
+        text = Path(result["filepath"]).read_text(encoding="utf-8")
+        assert ("\n" in text) is pretty
+        assert json.loads(text)["content"] == content
+
+    @pytest.mark.parametrize("pretty", [False, True], ids=["compact", "pretty"])
+    def test_streamed_save_round_trips(self, temp_storage, pretty):
+        """Test that a streamed save loads back like a regular one."""
+        content = {"leaves": [{"id": i, "label": "Análisis"} for i in range(100)]}
+
+        result = save_analysis(
+            "test_project", "research", content, temp_storage, pretty, stream=True
+        )
+
+        text = Path(result["filepath"]).read_text(encoding="utf-8")
+        assert ("\n" in text) is pretty
+        loaded = load_analysis("test_project", "research", storage_dir=temp_storage)
+        assert loaded["content"] == content
+
+    def test_failed_streamed_save_leaves_no_files(self, temp_storage):
+        """Test that an encoding error mid-stream leaves nothing behind."""
+        with pytest.raises(TypeError):
+            save_analysis(
+                "test_project", "research", {"bad": object()}, temp_storage, stream=True
+            )
+
+        assert list((Path(temp_storage) / "test_project").iterdir()) == []
+
     def test_raises_error_for_invalid_type(self, temp_storage):
         """Test that invalid analysis type raises error."""
         with pytest.raises(ValueError, match="Invalid analysis_type"):
@@ -209,6 +411,44 @@ class TestLoadAnalysis:
         assert result["content"]["version"] == "1"
         assert result["metadata"]["version"] == 1
 
+    def test_loads_matrix_saved_by_api(self, temp_storage):
+        """Test the generic "matrix" type the API saves and loads."""
+        matrix = {"matrix_type": "prioritization", "quadrants": {}}
+        save_analysis("test_project", "matrix", {"matrix": matrix}, temp_storage)
+
+        result = load_analysis("test_project", "matrix", storage_dir=temp_storage)
+
+        assert result["content"]["matrix"] == matrix
+        assert result["metadata"]["analysis_type"] == "matrix"
+
+    def test_loads_latest_version_numerically(self, temp_storage):
+        """Test that version 10 is newer than version 9."""
+        save_analysis_many(
+            "test_project",
+            "hypothesis_tree",
+            [{"v": v} for v in range(1, 11)],
+            temp_storage,
+        )
+
+        result = load_analysis(
+            "test_project", "hypothesis_tree", storage_dir=temp_storage
+        )
+
+        assert result["metadata"]["version"] == 10
+
+    def test_loads_large_analysis(self, temp_storage):
+        """Test loading an analysis large enough to be memory-mapped."""
+        content = {"leaves": [{"id": i, "notes": "x" * 100} for i in range(1000)]}
+
+        result = save_analysis("test_project", "hypothesis_tree", content, temp_storage)
+        assert os.path.getsize(result["filepath"]) >= 64 * 1024
+
+        loaded = load_analysis(
+            "test_project", "hypothesis_tree", storage_dir=temp_storage
+        )
+
+        assert loaded["content"] == content
+
     def test_lists_all_analyses_when_type_not_specified(self, temp_storage):
         """Test listing all analyses when no type specified."""
         save_analysis("test_project", "hypothesis_tree", {"a": 1}, temp_storage)
@@ -226,6 +466,17 @@ class TestLoadAnalysis:
         with pytest.raises(FileNotFoundError, match="No saved analyses found"):
             load_analysis("nonexistent_project", storage_dir=temp_storage)
 
+    @pytest.mark.parametrize("version", [None, 1], ids=["latest", "specific"])
+    def test_missing_project_error_for_typed_load(self, temp_storage, version):
+        """Test that typed loads from a missing project name the project."""
+        with pytest.raises(FileNotFoundError, match="No saved analyses found"):
+            load_analysis(
+                "nonexistent_project",
+                "hypothesis_tree",
+                version=version,
+                storage_dir=temp_storage,
+            )
+
     def test_raises_error_for_nonexistent_version(self, temp_storage):
         """Test error for nonexistent version."""
         save_analysis("test_project", "hypothesis_tree", {"a": 1}, temp_storage)
@@ -258,41 +509,48 @@ class TestLoadAnalysis:
 class TestSanitizeFilename:
     """Test _sanitize_filename function."""
 
-    def test_removes_special_characters(self):
-        """Test removing special characters."""
-        result = _sanitize_filename("Project!@# with $%^ special &*() chars")
-        assert result == "project_with_special_chars"
-
-    def test_replaces_spaces_with_underscores(self):
-        """Test replacing spaces with underscores."""
-        result = _sanitize_filename("My Test Project")
-        assert result == "my_test_project"
-
-    def test_removes_consecutive_underscores(self):
-        """Test removing consecutive underscores."""
-        result = _sanitize_filename("test___project__name")
-        assert result == "test_project_name"
-
-    def test_converts_to_lowercase(self):
-        """Test converting to lowercase."""
-        result = _sanitize_filename("TestProject")
-        assert result == "testproject"
-
-    def test_preserves_hyphens(self):
-        """Test preserving hyphens."""
-        result = _sanitize_filename("test-project-name")
-        assert result == "test-project-name"
-
-    def test_limits_length(self):
-        """Test limiting length to 100 characters."""
-        long_name = "a" * 150
-        result = _sanitize_filename(long_name)
-        assert len(result) == 100
-
-    def test_strips_leading_trailing_underscores(self):
-        """Test stripping leading/trailing underscores."""
-        result = _sanitize_filename("__test_project__")
-        assert result == "test_project"
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("Project!@# with $%^ special &*() chars", "project_with_special_chars"),
+            ("My Test Project", "my_test_project"),
+            ("test___project__name", "test_project_name"),
+            ("TestProject", "testproject"),
+            ("test-project-name", "test-project-name"),
+            ("a" * 150, "a" * 100),
+            ("__test_project__", "test_project"),
+        ],
+        ids=[
+            "special_characters",
+            "spaces",
+            "consecutive_underscores",
+            "lowercase",
+            "hyphens",
+            "length_limit",
+            "leading_trailing_underscores",
+        ],
+    )
+    def test_sanitize_filename(self, raw, expected):
+        """Test sanitizing a name for use as a filename."""
+        assert _sanitize_filename(raw) == expected
+
+
+class TestPaths:
+    """Test _paths function."""
+
+    def test_resolves_project_paths(self, temp_storage):
+        """Test that paths are built from the sanitized project name."""
+        paths = _paths(temp_storage, "My Test Project")
+
+        assert paths.base_dir == temp_storage
+        assert paths.safe_project_name == "my_test_project"
+        assert paths.project_dir == os.path.join(temp_storage, "my_test_project")
+
+    def test_reuses_cached_paths(self, temp_storage):
+        """Test that repeated lookups return the same object."""
+        assert _paths(temp_storage, "test_project") is _paths(
+            temp_storage, "test_project"
+        )
 
 
 class TestDeleteAnalysis:
@@ -327,6 +585,22 @@ class TestDeleteAnalysis:
         )
         assert loaded["metadata"]["version"] == 2
 
+    def test_save_after_delete_does_not_overwrite(self, temp_storage):
+        """Test that saving after deleting an older version keeps newer ones."""
+        save_analysis("test_project", "hypothesis_tree", {"v": 1}, temp_storage)
+        save_analysis("test_project", "hypothesis_tree", {"v": 2}, temp_storage)
+        delete_analysis("test_project", "hypothesis_tree", 1, temp_storage)
+
+        result = save_analysis(
+            "test_project", "hypothesis_tree", {"v": 3}, temp_storage
+        )
+
+        assert result["version"] == 3
+        loaded = load_analysis(
+            "test_project", "hypothesis_tree", version=2, storage_dir=temp_storage
+        )
+        assert loaded["content"] == {"v": 2}
+
     def test_raises_error_for_nonexistent_version(self, temp_storage):
         """Test error when deleting nonexistent version."""
         save_analysis("test_project", "hypothesis_tree", {"a": 1}, temp_storage)
@@ -352,6 +626,24 @@ class TestGetLatestVersion:
 
         assert version == 3
 
+    def test_save_skips_versions_written_elsewhere(self, temp_storage):
+        """Test that a stale cached version never overwrites an existing file."""
+        save_analysis("test_project", "hypothesis_tree", {"v": 1}, temp_storage)
+
+        # Simulate another process saving version 2 behind the cache
+        project_dir = Path(temp_storage) / "test_project"
+        (project_dir / "hypothesis_tree_v2.json").write_text("{}", encoding="utf-8")
+
+        result = save_analysis(
+            "test_project", "hypothesis_tree", {"v": 3}, temp_storage
+        )
+
+        latest = get_latest_version(
+            "test_project", "hypothesis_tree", storage_dir=temp_storage
+        )
+        assert result["version"] == 3
+        assert latest == 3
+
     def test_returns_zero_for_nonexistent_project(self, temp_storage):
         """Test returning 0 for nonexistent project."""
         version = get_latest_version(
@@ -368,6 +660,17 @@ class TestGetLatestVersion:
 
         assert version == 0
 
+    def test_ignores_types_sharing_a_prefix(self, temp_storage):
+        """Test that "matrix" does not count "matrix_risk_register" versions."""
+        save_analysis("test_project", "matrix", {"a": 1}, temp_storage)
+        save_analysis_many(
+            "test_project", "matrix_risk_register", [{"b": 1}, {"b": 2}], temp_storage
+        )
+        project_dir = Path(temp_storage) / "test_project"
+
+        assert _scan_latest_version(project_dir, "matrix") == 1
+        assert _scan_latest_version(project_dir, "matrix_risk_register") == 2
+
 
 class TestListProjectAnalyses:
     """Test _list_project_analyses function."""
@@ -398,6 +701,19 @@ class TestListProjectAnalyses:
         versions = [item["version"] for item in result["analyses"]["hypothesis_tree"]]
         assert versions == [3, 2, 1]
 
+    def test_ignores_non_analysis_files(self, temp_storage):
+        """Test that files not named {type}_v{N}.json are skipped."""
+        save_analysis("test_project", "hypothesis_tree", {"v": 1}, temp_storage)
+
+        project_dir = Path(temp_storage) / "test_project"
+        (project_dir / "notes.json").write_text("{}", encoding="utf-8")
+        (project_dir / "hypothesis_tree_v2.json.bak").write_text("", encoding="utf-8")
+
+        result = _list_project_analyses(project_dir, "test_project")
+
+        assert result["total_count"] == 1
+        assert result["analyses"]["hypothesis_tree"][0]["timestamp"]
+
     def test_handles_empty_project(self, temp_storage):
         """Test handling project with no analyses."""
         project_dir = Path(temp_storage) / "empty_project"
@@ -409,6 +725,172 @@ class TestListProjectAnalyses:
         assert result["analyses"] == {}
 
 
+class TestBuildIndex:
+    """Test the optional SQLite metadata index."""
+
+    def test_indexes_existing_analyses(self, temp_storage):
+        """Test that building the index records files already on disk."""
+        save_analysis("project_a", "hypothesis_tree", {"v": 1}, temp_storage)
+        save_analysis("project_b", "research", {"v": 1}, temp_storage)
+
+        result = build_index(temp_storage)
+
+        assert result["indexed"] == 2
+        assert Path(result["index_path"]).exists()
+
+    def test_saves_and_deletes_update_index(self, temp_storage):
+        """Test that listings and versions come from the maintained index."""
+        build_index(temp_storage)
+        save_analysis("test_project", "hypothesis_tree", {"v": 1}, temp_storage)
+        saved = save_analysis("test_project", "hypothesis_tree", {"v": 2}, temp_storage)
+        delete_analysis("test_project", "hypothesis_tree", 1, temp_storage)
+
+        project_dir = Path(temp_storage) / "test_project"
+        result = _list_project_analyses(project_dir, "test_project")
+
+        mtime = datetime.fromtimestamp(os.stat(saved["filepath"]).st_mtime)
+        assert result["total_count"] == 1
+        assert result["analyses"]["hypothesis_tree"][0] == {
+            "version": 2,
+            "timestamp": mtime.isoformat(),
+            "filepath": saved["filepath"],
+        }
+        assert get_latest_version("test_project", "hypothesis_tree", temp_storage) == 2
+
+    def test_batch_save_updates_index(self, temp_storage):
+        """Test that every version from a batch save is indexed."""
+        build_index(temp_storage)
+        save_analysis_many(
+            "test_project", "research", [{"v": v} for v in range(1, 12)], temp_storage
+        )
+        save_analysis("test_project", "hypothesis_tree", {"v": 1}, temp_storage)
+
+        project_dir = Path(temp_storage) / "test_project"
+        result = _list_project_analyses(project_dir, "test_project")
+
+        versions = [item["version"] for item in result["analyses"]["research"]]
+        assert versions == list(range(11, 0, -1))
+        assert result["total_count"] == 12
+
+    def test_index_and_scan_report_same_rows(self, temp_storage):
+        """Test that indexed listings match a directory scan, timestamps included."""
+        save_analysis("test_project", "research", {"v": 1}, temp_storage)
+        build_index(temp_storage)
+        save_analysis_many("test_project", "research", [{"v": 2}], temp_storage)
+        save_analysis("test_project", "hypothesis_tree", {"v": 1}, temp_storage)
+
+        project_dir = os.path.join(temp_storage, "test_project")
+        listed = _list_project_analyses(project_dir, "test_project")["analyses"]
+
+        indexed = sorted(
+            (analysis_type, row["version"], row["timestamp"], row["filepath"])
+            for analysis_type, rows in listed.items()
+            for row in rows
+        )
+        assert indexed == sorted(_scan_project_analyses(project_dir))
+
+    def test_index_built_elsewhere_is_kept_current(self, temp_storage, monkeypatch):
+        """Test a writer that started before another process built the index."""
+        # This process looks for an index, and finds none, on its first save
+        save_analysis("test_project", "research", {"v": 1}, temp_storage)
+        with other_process(monkeypatch):
+            build_index(temp_storage)
+
+        save_analysis("test_project", "research", {"v": 2}, temp_storage)
+
+        with other_process(monkeypatch):
+            listed = load_analysis("test_project", storage_dir=temp_storage)
+            latest = get_latest_version(
+                "test_project", "research", storage_dir=temp_storage
+            )
+        versions = [row["version"] for row in listed["analyses"]["research"]]
+        assert versions == [2, 1]
+        assert latest == 2
+
+    def test_index_errors_do_not_fail_saves(self, temp_storage, caplog):
+        """Test that a broken index is logged and the save still lands."""
+        index_path = build_index(temp_storage)["index_path"]
+        with closing(sqlite3.connect(index_path)) as conn, conn:
+            conn.execute("DROP TABLE analyses")
+
+        result = save_analysis("test_project", "research", {"a": 1}, temp_storage)
+
+        assert result["version"] == 1
+        assert os.path.exists(result["filepath"])
+        assert "Index update failed" in caplog.text
+
+    def test_saves_and_loads_with_index(self, temp_storage):
+        """Test a save and load round trip once the index exists."""
+        build_index(temp_storage)
+
+        result = save_analysis("test_project", "research", {"a": 1}, temp_storage)
+        loaded = load_analysis("test_project", "research", storage_dir=temp_storage)
+
+        assert result["version"] == 1
+        assert loaded["content"] == {"a": 1}
+
+
+class TestJsonBackends:
+    """Test that the stdlib and orjson backends agree, except where documented."""
+
+    def test_rejects_datetime_values(self, temp_storage, json_backend):
+        """Test that datetimes raise TypeError under both backends."""
+        with pytest.raises(TypeError, match="not JSON serializable"):
+            save_analysis(
+                "test_project", "research", {"at": datetime.now()}, temp_storage
+            )
+
+    def test_writes_large_integers(self, temp_storage, json_backend):
+        """Test that integers beyond 64 bits are written the same way."""
+        big = 2**70 + 1
+        result = save_analysis("test_project", "research", {"n": big}, temp_storage)
+
+        with open(result["filepath"], encoding="utf-8") as f:
+            assert json.load(f)["content"]["n"] == big
+
+        loaded = load_analysis("test_project", "research", storage_dir=temp_storage)
+        # orjson loads integers beyond 64 bits as floats
+        expected = float(big) if json_backend == "orjson" else big
+        assert loaded["content"]["n"] == expected
+
+    def test_loads_nan_written_by_stdlib(self, temp_storage, json_backend):
+        """Test that files with NaN tokens load under both backends."""
+        project_dir = Path(temp_storage) / "test_project"
+        project_dir.mkdir()
+        save_data = {"metadata": {"version": 1}, "content": {"x": float("nan")}}
+        (project_dir / "research_v1.json").write_text(
+            json.dumps(save_data), encoding="utf-8"
+        )
+
+        loaded = load_analysis(
+            "test_project", "research", version=1, storage_dir=temp_storage
+        )
+
+        assert math.isnan(loaded["content"]["x"])
+
+    def test_non_finite_floats(self, temp_storage, json_backend):
+        """Test that orjson writes Infinity as null and json keeps it."""
+        save_analysis("test_project", "research", {"x": math.inf}, temp_storage)
+
+        loaded = load_analysis("test_project", "research", storage_dir=temp_storage)
+
+        expected = None if json_backend == "orjson" else math.inf
+        assert loaded["content"]["x"] == expected
+
+    def test_uuid_values(self, temp_storage, json_backend):
+        """Test that orjson writes UUIDs as strings and json rejects them."""
+        value = uuid.UUID(int=1)
+
+        if json_backend == "json":
+            with pytest.raises(TypeError, match="not JSON serializable"):
+                save_analysis("test_project", "research", {"id": value}, temp_storage)
+            return
+
+        save_analysis("test_project", "research", {"id": value}, temp_storage)
+        loaded = load_analysis("test_project", "research", storage_dir=temp_storage)
+        assert loaded["content"]["id"] == str(value)
+
+
 class TestIntegration:
     """Integration tests."""
 
@@ -461,9 +943,9 @@ class TestIntegration:
     def test_version_management(self, temp_storage):
         """Test version management across saves and deletes."""
         # Save 3 versions
-        save_analysis("test", "hypothesis_tree", {"v": 1}, temp_storage)
-        save_analysis("test", "hypothesis_tree", {"v": 2}, temp_storage)
-        save_analysis("test", "hypothesis_tree", {"v": 3}, temp_storage)
+        save_analysis_many(
+            "test", "hypothesis_tree", [{"v": 1}, {"v": 2}, {"v": 3}], temp_storage
+        )
 
         # Check latest version
         assert get_latest_version("test", "hypothesis_tree", temp_storage) == 3